@@ -16,7 +16,7 @@ from bot.core import init_notifications, NotificationType
 from bot.core.usage_stats import log_event
 from bot.core.storage import Database
 from bot.core.services import StarvellService
-from bot.handlers import router
+from bot.handlers import router, fallback_router
 from bot.core.middlewares import AuthMiddleware
 from bot.features.tasks import BackgroundTasks
 from bot.features.auto_delivery import AutoDeliveryService
@@ -182,6 +182,8 @@ async def main():
     
     # Регистрируем роутер
     dp.include_router(router)
+    # Последним - ответ на кнопки, которые не обработал ни один хэндлер
+    dp.include_router(fallback_router)
     
     # Добавляем зависимости в контекст
     dp.workflow_data.update({
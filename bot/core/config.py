@@ -64,6 +64,7 @@ class ConfigManager:
             'enabled': 'true',
             'token': '',
             'secretKeyHash': '',
+            'keyAlgo': 'sha256',
             'adminIds': '[]'
         }
         
@@ -148,6 +149,7 @@ class ConfigManager:
                 'enabled': 'true',
                 'token': '',
                 'secretKeyHash': '',
+                'keyAlgo': 'sha256',
                 'adminIds': '[]'
             },
             'Notifications': {
@@ -330,6 +332,10 @@ class BotConfig:
     def PASSWORD_HASH() -> str:
         return _config_manager.get('Telegram', 'secretKeyHash', '')
     
+    @staticmethod
+    def PASSWORD_ALGO() -> str:
+        return _config_manager.get('Telegram', 'keyAlgo', 'sha256')
+    
     @staticmethod
     def ADMIN_IDS() -> list:
         return _config_manager.get('Telegram', 'adminIds', [])
@@ -599,6 +605,8 @@ class BotConfig:
             raise ValueError("Telegram.token не установлен в _main.cfg")
         if not cls.PASSWORD_HASH():
             raise ValueError("Telegram.secretKeyHash не установлен в _main.cfg")
+        if cls.PASSWORD_ALGO() not in ('sha256', 'blake2b'):
+            raise ValueError("Telegram.keyAlgo должен быть sha256 или blake2b")
         if not cls.STARVELL_SESSION():
             raise ValueError("Starvell.session_cookie не установлен в _main.cfg")
         return True
@@ -665,14 +665,9 @@ class NotificationManager:
         
         # Вызываем хэндлеры плагинов асинхронно
         import asyncio
-        for handler in self.plugin_manager.new_order_handlers:
+        # В списке только хэндлеры включённых плагинов
+        for handler in self.plugin_manager.active_new_order_handlers:
             try:
-                # Проверяем, включён ли плагин
-                plugin_uuid = getattr(handler, 'plugin_uuid', None)
-                if plugin_uuid and plugin_uuid in self.plugin_manager.plugins:
-                    if not self.plugin_manager.plugins[plugin_uuid].enabled:
-                        continue
-                
                 # Вызываем асинхронный хэндлер с передачей starvell_service
                 if asyncio.iscoroutinefunction(handler):
                     await handler(plugin_order_data, starvell_service=self.starvell_service)
@@ -696,14 +691,9 @@ class NotificationManager:
         
         # Вызываем хэндлеры плагинов асинхронно
         import asyncio
-        for handler in self.plugin_manager.new_message_handlers:
+        # В списке только хэндлеры включённых плагинов
+        for handler in self.plugin_manager.active_new_message_handlers:
             try:
-                # Проверяем, включён ли плагин
-                plugin_uuid = getattr(handler, 'plugin_uuid', None)
-                if plugin_uuid and plugin_uuid in self.plugin_manager.plugins:
-                    if not self.plugin_manager.plugins[plugin_uuid].enabled:
-                        continue
-                
                 # Вызываем асинхронный хэндлер с передачей starvell_service
                 if asyncio.iscoroutinefunction(handler):
                     await handler(plugin_message_data, starvell_service=self.starvell_service)
@@ -2,6 +2,6 @@
 Обработчики Telegram сообщений и callback'ов.
 """
 
-from .handlers import router
+from .handlers import router, fallback_router
 
-__all__ = ['router']
+__all__ = ['router', 'fallback_router']
@@ -11,7 +11,10 @@ from aiogram.fsm.state import State, StatesGroup
 from bot.keyboards import (
     get_blacklist_menu,
     get_blacklist_user_edit_menu,
-    get_back_button
+    get_back_button,
+    BlUser,
+    CBT,
+    cb,
 )
 from bot.core.config import BotConfig, get_config_manager
 
@@ -44,11 +47,7 @@ async def show_blacklist(callback: CallbackQuery, db, **kwargs):
                 block_delivery = BotConfig.get(f"{section}.block_delivery", True, bool)
                 block_response = BotConfig.get(f"{section}.block_response", True, bool)
                 
-                blacklist.append({
-                    "username": username,
-                    "block_delivery": block_delivery,
-                    "block_response": block_response
-                })
+                blacklist.append(BlUser(username, block_delivery, block_response))
         
         keyboard = get_blacklist_menu(blacklist, offset)
         
@@ -66,7 +65,7 @@ async def show_blacklist(callback: CallbackQuery, db, **kwargs):
         await callback.answer("❌ Ошибка при загрузке", show_alert=True)
 
 
-@router.callback_query(F.data == "bl_add")
+@router.callback_query(F.data == cb(CBT.BL_ADD_USER))
 async def add_to_blacklist(callback: CallbackQuery, state: FSMContext):
     """Начать добавление пользователя в ЧС"""
     await state.set_state(BlacklistStates.waiting_username)
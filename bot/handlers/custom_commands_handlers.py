@@ -10,7 +10,7 @@ from aiogram.types import CallbackQuery, Message
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
-from bot.keyboards.keyboards import get_custom_commands_menu, CBT
+from bot.keyboards.keyboards import get_custom_commands_menu, CBT, cb
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -58,7 +58,7 @@ def save_commands(data):
         logger.error(f"Ошибка сохранения команд: {e}")
 
 
-@router.callback_query(F.data == CBT.CUSTOM_COMMANDS)
+@router.callback_query(F.data == cb(CBT.CUSTOM_COMMANDS))
 async def callback_custom_commands_menu(callback: CallbackQuery, **kwargs):
     """Меню кастомных команд"""
     await callback.answer()
@@ -87,7 +87,7 @@ async def callback_custom_commands_menu(callback: CallbackQuery, **kwargs):
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.TOGGLE_CUSTOM_COMMANDS)
+@router.callback_query(F.data == cb(CBT.TOGGLE_CUSTOM_COMMANDS))
 async def callback_toggle_custom_commands(callback: CallbackQuery, **kwargs):
     """Переключить кастомные команды"""
     data = load_commands()
@@ -121,7 +121,7 @@ async def callback_toggle_custom_commands(callback: CallbackQuery, **kwargs):
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.ADD_CUSTOM_COMMAND)
+@router.callback_query(F.data == cb(CBT.ADD_CUSTOM_COMMAND))
 async def callback_add_custom_command(callback: CallbackQuery, state: FSMContext, **kwargs):
     """Начать добавление команды"""
     await callback.answer()
@@ -276,7 +276,7 @@ async def callback_view_command(callback: CallbackQuery, **kwargs):
         [
             InlineKeyboardButton(
                 text="⬅️ Назад",
-                callback_data=CBT.CUSTOM_COMMANDS
+                callback_data=cb(CBT.CUSTOM_COMMANDS)
             )
         ]
     ])
@@ -323,7 +323,7 @@ async def callback_delete_command(callback: CallbackQuery, **kwargs):
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.CHANGE_PREFIX)
+@router.callback_query(F.data == cb(CBT.CHANGE_PREFIX))
 async def callback_change_prefix(callback: CallbackQuery, state: FSMContext, **kwargs):
     """Изменить префикс"""
     await callback.answer()
@@ -16,6 +16,8 @@ from bot.keyboards import (
     get_configs_menu,
     get_authorized_users_menu,
     CBT,
+    cb,
+    cb_prefix,
 )
 from bot.core.config import BotConfig, get_config_manager
 
@@ -32,7 +34,7 @@ class EditTextStates(StatesGroup):
 
 # === Вторая страница главного меню ===
 
-@router.callback_query(F.data == CBT.MAIN_PAGE_2)
+@router.callback_query(F.data == cb(CBT.MAIN_PAGE_2))
 async def callback_main_page_2(callback: CallbackQuery):
     """Вторая страница главного меню"""
     await callback.answer()
@@ -50,7 +52,7 @@ async def callback_main_page_2(callback: CallbackQuery):
 
 # === Ответ на подтверждение заказа ===
 
-@router.callback_query(F.data == CBT.ORDER_CONFIRM_RESPONSE)
+@router.callback_query(F.data == cb(CBT.ORDER_CONFIRM_RESPONSE))
 async def callback_order_confirm_response(callback: CallbackQuery):
     """Меню настройки ответа на подтверждение заказа"""
     await callback.answer()
@@ -117,7 +119,7 @@ async def process_order_confirm_text(message: Message, state: FSMContext):
 
 # === Ответ на отзыв ===
 
-@router.callback_query(F.data == CBT.REVIEW_RESPONSE)
+@router.callback_query(F.data == cb(CBT.REVIEW_RESPONSE))
 async def callback_review_response(callback: CallbackQuery):
     """Меню настройки ответа на отзыв"""
     await callback.answer()
@@ -184,7 +186,7 @@ async def process_review_text(message: Message, state: FSMContext):
 
 # === Конфиги ===
 
-@router.callback_query(F.data == CBT.CONFIGS_MENU)
+@router.callback_query(F.data == cb(CBT.CONFIGS_MENU))
 async def callback_configs_menu(callback: CallbackQuery):
     """Меню управления конфигами"""
     await callback.answer()
@@ -198,7 +200,7 @@ async def callback_configs_menu(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.CONFIG_DOWNLOAD)
+@router.callback_query(F.data == cb(CBT.CONFIG_DOWNLOAD))
 async def callback_config_download(callback: CallbackQuery):
     """Скачать конфиг"""
     config_manager = get_config_manager()
@@ -218,7 +220,7 @@ async def callback_config_download(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.CONFIG_UPLOAD)
+@router.callback_query(F.data == cb(CBT.CONFIG_UPLOAD))
 async def callback_config_upload(callback: CallbackQuery, state: FSMContext):
     """Начать загрузку конфига"""
     await callback.answer()
@@ -279,7 +281,7 @@ async def process_config_upload(message: Message, state: FSMContext, bot):
 
 # === Авторизованные пользователи ===
 
-@router.callback_query(F.data == CBT.AUTHORIZED_USERS)
+@router.callback_query(F.data == cb(CBT.AUTHORIZED_USERS))
 async def callback_authorized_users(callback: CallbackQuery):
     """Меню авторизованных пользователей"""
     await callback.answer()
@@ -304,7 +306,7 @@ async def callback_authorized_users(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data.startswith(f"{CBT.REMOVE_AUTH_USER}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.REMOVE_AUTH_USER)))
 async def callback_remove_auth_user(callback: CallbackQuery):
     """Удалить авторизованного пользователя"""
     user_id = int(callback.data.split(":")[1])
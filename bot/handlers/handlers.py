@@ -22,6 +22,9 @@ from bot.keyboards import (
     get_select_template_menu,
     get_custom_commands_menu,
     CBT,
+    cb,
+    BlUser,
+    PluginRow,
 )
 from bot.handlers import auto_delivery_handlers, blacklist_handlers, plugins_handlers, templates_handlers, extra_handlers, custom_commands_handlers
 
@@ -77,8 +80,10 @@ class AutoTicketState(StatesGroup):
 
 # === Функции авторизации ===
 
-def hash_password(password: str) -> str:
-    """Хеширование пароля"""
+def hash_password(password: str, algo: str = "sha256") -> str:
+    """Хеширование пароля (algo - Telegram.keyAlgo из конфига, sha256 для старых конфигов)"""
+    if algo == "blake2b":
+        return hashlib.blake2b(password.encode(), digest_size=32, person=b'starvell').hexdigest()
     return hashlib.sha256(password.encode()).hexdigest()
 
 
@@ -611,7 +616,7 @@ async def callback_profile_back(callback: CallbackQuery, starvell, **kwargs):
         )],
         [InlineKeyboardButton(
             text="🔙 Назад",
-            callback_data=CBT.MAIN
+            callback_data=cb(CBT.MAIN)
         )]
     ])
     
@@ -700,7 +705,7 @@ async def cmd_restart(message: Message, **kwargs):
 async def process_password(message: Message, state: FSMContext):
     """Обработка ввода пароля"""
     password = message.text
-    password_hash = hash_password(password)
+    password_hash = hash_password(password, BotConfig.PASSWORD_ALGO())
     stored_hash = BotConfig.PASSWORD_HASH()
     
     # Удаляем сообщение с паролем
@@ -763,7 +768,7 @@ async def callback_update_now(callback: CallbackQuery, auto_update, **kwargs):
         await callback.message.edit_text(response, parse_mode="HTML")
 
 
-@router.callback_query(F.data == CBT.MAIN)
+@router.callback_query(F.data == cb(CBT.MAIN))
 async def callback_main_menu(callback: CallbackQuery, auto_update, **kwargs):
     """Главное меню"""
     await callback.answer()
@@ -779,7 +784,7 @@ async def callback_main_menu(callback: CallbackQuery, auto_update, **kwargs):
     )
 
 
-@router.callback_query(F.data == CBT.GLOBAL_SWITCHES)
+@router.callback_query(F.data == cb(CBT.GLOBAL_SWITCHES))
 async def callback_global_switches(callback: CallbackQuery):
     """Меню глобальных переключателей"""
     await callback.answer()
@@ -806,7 +811,7 @@ async def callback_global_switches(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_BUMP)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_BUMP))
 async def callback_switch_auto_bump(callback: CallbackQuery, auto_raise=None, **kwargs):
     """Переключить авто-поднятие"""
     # Переключаем
@@ -842,7 +847,7 @@ async def callback_switch_auto_bump(callback: CallbackQuery, auto_raise=None, **
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_DELIVERY)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_DELIVERY))
 async def callback_switch_auto_delivery(callback: CallbackQuery):
     """Переключить авто-выдачу"""
     # Переключаем
@@ -874,7 +879,7 @@ async def callback_switch_auto_delivery(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_RESTORE)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_RESTORE))
 async def callback_switch_auto_restore(callback: CallbackQuery):
     """Переключить авто-восстановление"""
     # Переключаем
@@ -903,7 +908,7 @@ async def callback_switch_auto_restore(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_READ)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_READ))
 async def callback_switch_auto_read(callback: CallbackQuery):
     """Переключить авто-прочтение чатов"""
     # Переключаем
@@ -933,7 +938,7 @@ async def callback_switch_auto_read(callback: CallbackQuery):
 
 
 
-@router.callback_query(F.data == CBT.SWITCH_USE_WATERMARK)
+@router.callback_query(F.data == cb(CBT.SWITCH_USE_WATERMARK))
 async def callback_switch_use_watermark(callback: CallbackQuery):
     """Переключить использование вотермарки в сообщениях"""
     current = BotConfig.USE_WATERMARK()
@@ -960,7 +965,7 @@ async def callback_switch_use_watermark(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.AUTO_TICKET_SETTINGS)
+@router.callback_query(F.data == cb(CBT.AUTO_TICKET_SETTINGS))
 async def callback_auto_ticket_settings(callback: CallbackQuery):
     """Меню настроек авто-тикета"""
     enabled = BotConfig.AUTO_TICKET_ENABLED()
@@ -980,7 +985,7 @@ async def callback_auto_ticket_settings(callback: CallbackQuery):
         reply_markup=get_auto_ticket_settings_menu(enabled, interval, max_orders, notify)
     )
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_TICKET_INTERNAL)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_TICKET_INTERNAL))
 async def callback_switch_auto_ticket_internal(callback: CallbackQuery):
     """Переключить авто-тикет (внутри настроек)"""
     # Переключаем
@@ -1010,7 +1015,7 @@ async def callback_switch_auto_ticket_internal(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_TICKET)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_TICKET))
 async def callback_switch_auto_ticket(callback: CallbackQuery):
     """Переключить авто-тикет (глобальное меню)"""
     # Переключаем
@@ -1039,7 +1044,7 @@ async def callback_switch_auto_ticket(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_TICKET_NOTIFY)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_TICKET_NOTIFY))
 async def callback_switch_auto_ticket_notify(callback: CallbackQuery):
     """Переключить уведомления авто-тикета"""
     current = BotConfig.NOTIFY_AUTO_TICKET()
@@ -1066,7 +1071,7 @@ async def callback_switch_auto_ticket_notify(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.AUTO_TICKET_SET_INTERVAL)
+@router.callback_query(F.data == cb(CBT.AUTO_TICKET_SET_INTERVAL))
 async def callback_auto_ticket_set_interval(callback: CallbackQuery, state: FSMContext):
     """Запросить интервал проверки вручную"""
     await state.set_state(AutoTicketState.waiting_for_interval)
@@ -1111,7 +1116,7 @@ async def process_auto_ticket_interval(message: Message, state: FSMContext):
         )
 
 
-@router.callback_query(F.data == CBT.AUTO_TICKET_SET_MAX)
+@router.callback_query(F.data == cb(CBT.AUTO_TICKET_SET_MAX))
 async def callback_auto_ticket_set_max(callback: CallbackQuery, state: FSMContext):
     """Запросить макс. заказов вручную"""
     await state.set_state(AutoTicketState.waiting_for_max_orders)
@@ -1153,7 +1158,7 @@ async def process_auto_ticket_max_orders(message: Message, state: FSMContext):
         )
 
 
-@router.callback_query(F.data == CBT.SWITCH_AUTO_INSTALL)
+@router.callback_query(F.data == cb(CBT.SWITCH_AUTO_INSTALL))
 async def callback_switch_auto_install(callback: CallbackQuery):
     """Переключить автоматическую установку обновлений"""
     # Переключаем
@@ -1182,7 +1187,7 @@ async def callback_switch_auto_install(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_ORDER_CONFIRM)
+@router.callback_query(F.data == cb(CBT.SWITCH_ORDER_CONFIRM))
 async def callback_switch_order_confirm(callback: CallbackQuery, auto_response, **kwargs):
     """Переключить авто-ответ на подтверждение заказа"""
     # Переключаем
@@ -1216,7 +1221,7 @@ async def callback_switch_order_confirm(callback: CallbackQuery, auto_response,
     )
 
 
-@router.callback_query(F.data == CBT.SWITCH_REVIEW_RESPONSE)
+@router.callback_query(F.data == cb(CBT.SWITCH_REVIEW_RESPONSE))
 async def callback_switch_review_response(callback: CallbackQuery, auto_response, **kwargs):
     """Переключить авто-ответ на отзыв"""
     # Переключаем
@@ -1256,7 +1261,7 @@ async def callback_empty(callback: CallbackQuery):
     await callback.answer()
 
 
-@router.callback_query(F.data == CBT.AUTO_DELIVERY)
+@router.callback_query(F.data == cb(CBT.AUTO_DELIVERY))
 async def callback_auto_delivery_menu(callback: CallbackQuery, auto_delivery, **kwargs):
     """Меню автовыдачи"""
     await callback.answer()
@@ -1271,7 +1276,7 @@ async def callback_auto_delivery_menu(callback: CallbackQuery, auto_delivery, **
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.BLACKLIST)
+@router.callback_query(F.data == cb(CBT.BLACKLIST))
 async def callback_blacklist_menu(callback: CallbackQuery, **kwargs):
     """Меню чёрного списка"""
     await callback.answer()
@@ -1287,11 +1292,7 @@ async def callback_blacklist_menu(callback: CallbackQuery, **kwargs):
             block_delivery = BotConfig.get(f"{section}.block_delivery", True, bool)
             block_response = BotConfig.get(f"{section}.block_response", True, bool)
             
-            blacklist.append({
-                "username": username,
-                "block_delivery": block_delivery,
-                "block_response": block_response
-            })
+            blacklist.append(BlUser(username, block_delivery, block_response))
     
     keyboard = get_blacklist_menu(blacklist, offset=0)
     
@@ -1301,25 +1302,20 @@ async def callback_blacklist_menu(callback: CallbackQuery, **kwargs):
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.PLUGINS)
+@router.callback_query(F.data == cb(CBT.PLUGINS))
 async def callback_plugins_menu(callback: CallbackQuery, plugin_manager, **kwargs):
     """Меню плагинов"""
     await callback.answer()
     
     # Получаем плагины
-    plugins_data = []
-    for uuid, plugin in plugin_manager.plugins.items():
-        plugins_data.append({
-            "uuid": uuid,
-            "name": plugin.name,
-            "version": plugin.version,
-            "description": plugin.description,
-            "enabled": plugin.enabled
-        })
+    plugins_data = [
+        PluginRow(uuid, plugin.name, plugin.enabled, plugin.version)
+        for uuid, plugin in plugin_manager.plugins.items()
+    ]
     
     keyboard = get_plugins_menu(plugins_data, offset=0)
     
-    enabled_count = sum(1 for p in plugins_data if p["enabled"])
+    enabled_count = sum(1 for p in plugins_data if p.enabled)
     disabled_count = len(plugins_data) - enabled_count
     
     text = "🧩 <b>Управление плагинами</b>\n\n"
@@ -1331,7 +1327,7 @@ async def callback_plugins_menu(callback: CallbackQuery, plugin_manager, **kwarg
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.ABOUT)
+@router.callback_query(F.data == cb(CBT.ABOUT))
 async def callback_about(callback: CallbackQuery):
     """Показать информацию о боте и ссылки автора"""
     await callback.answer()
@@ -1347,13 +1343,13 @@ async def callback_about(callback: CallbackQuery):
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
         [InlineKeyboardButton(text="🔗 GitHub", url="https://github.com/Hackep1551/Starvell-cardinal")],
-        [InlineKeyboardButton(text="🔙 Назад", callback_data=CBT.MAIN)]
+        [InlineKeyboardButton(text="🔙 Назад", callback_data=cb(CBT.MAIN))]
     ])
 
     await callback.message.edit_text(text, reply_markup=keyboard)
 
 
-@router.callback_query(F.data == CBT.NOTIFICATIONS)
+@router.callback_query(F.data == cb(CBT.NOTIFICATIONS))
 async def callback_notifications(callback: CallbackQuery):
     """Меню настроек уведомлений"""
     await callback.answer()
@@ -1382,7 +1378,7 @@ async def callback_notifications(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_MESSAGES)
+@router.callback_query(F.data == cb(CBT.NOTIF_MESSAGES))
 async def callback_notif_messages(callback: CallbackQuery):
     """Переключить уведомления о новых сообщениях"""
     current = BotConfig.NOTIFY_NEW_MESSAGES()
@@ -1412,7 +1408,7 @@ async def callback_notif_messages(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_ORDERS)
+@router.callback_query(F.data == cb(CBT.NOTIF_ORDERS))
 async def callback_notif_orders(callback: CallbackQuery):
     """Переключить уведомления о новых заказах"""
     current = BotConfig.NOTIFY_NEW_ORDERS()
@@ -1442,7 +1438,7 @@ async def callback_notif_orders(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_SUPPORT_MESSAGES)
+@router.callback_query(F.data == cb(CBT.NOTIF_SUPPORT_MESSAGES))
 async def callback_notif_support_messages(callback: CallbackQuery):
     """Переключить уведомления о сообщениях от поддержки"""
     current = BotConfig.NOTIFY_SUPPORT_MESSAGES()
@@ -1472,7 +1468,7 @@ async def callback_notif_support_messages(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_RESTORE)
+@router.callback_query(F.data == cb(CBT.NOTIF_RESTORE))
 async def callback_notif_restore(callback: CallbackQuery):
     """Переключить уведомления о восстановлении лота"""
     current = BotConfig.NOTIFY_LOT_RESTORE()
@@ -1501,7 +1497,7 @@ async def callback_notif_restore(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_START)
+@router.callback_query(F.data == cb(CBT.NOTIF_START))
 async def callback_notif_start(callback: CallbackQuery):
     """Переключить уведомления о запуске бота"""
     current = BotConfig.NOTIFY_BOT_START()
@@ -1531,7 +1527,7 @@ async def callback_notif_start(callback: CallbackQuery):
 
 
 
-@router.callback_query(F.data == CBT.NOTIF_AUTO_RESPONSES)
+@router.callback_query(F.data == cb(CBT.NOTIF_AUTO_RESPONSES))
 async def callback_notif_auto_responses(callback: CallbackQuery):
     """Переключить уведомления при выполнении автоответов/команд"""
     current = BotConfig.NOTIFY_AUTO_RESPONSES()
@@ -1559,7 +1555,7 @@ async def callback_notif_auto_responses(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_ORDER_CONFIRMED)
+@router.callback_query(F.data == cb(CBT.NOTIF_ORDER_CONFIRMED))
 async def callback_notif_order_confirmed(callback: CallbackQuery):
     """Переключить уведомления о подтверждении заказа"""
     current = BotConfig.NOTIFY_ORDER_CONFIRMED()
@@ -1587,7 +1583,7 @@ async def callback_notif_order_confirmed(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_AUTO_TICKET)
+@router.callback_query(F.data == cb(CBT.NOTIF_AUTO_TICKET))
 async def callback_notif_auto_ticket(callback: CallbackQuery):
     """Переключить уведомления об отправке авто-тикета"""
     current = BotConfig.NOTIFY_AUTO_TICKET()
@@ -1615,7 +1611,7 @@ async def callback_notif_auto_ticket(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_STOP)
+@router.callback_query(F.data == cb(CBT.NOTIF_STOP))
 async def callback_notif_stop(callback: CallbackQuery):
     """Переключить уведомления об остановке бота"""
     current = BotConfig.NOTIFY_BOT_STOP()
@@ -1643,7 +1639,7 @@ async def callback_notif_stop(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.NOTIF_REVIEW)
+@router.callback_query(F.data == cb(CBT.NOTIF_REVIEW))
 async def callback_notif_review(callback: CallbackQuery):
     """Переключить уведомления о новых отзывах"""
     current = BotConfig.NOTIFY_REVIEW()
@@ -1836,3 +1832,16 @@ async def handle_refund_cancel(callback: CallbackQuery):
     await callback.answer("Отменено")
 
 
+
+
+# === Устаревшие кнопки ===
+
+# Подключается к диспетчеру после основного роутера и ловит callback'и, которые никто не обработал:
+# например, кнопки в старых сообщениях с callback_data прежнего формата (до перехода на номера CBT)
+fallback_router = Router()
+
+
+@fallback_router.callback_query()
+async def callback_outdated(callback: CallbackQuery):
+    """Неизвестная или устаревшая кнопка"""
+    await callback.answer("⚠️ Это меню устарело. Откройте его заново: /menu", show_alert=True)
@@ -8,7 +8,10 @@ from aiogram.types import CallbackQuery, InlineKeyboardMarkup, InlineKeyboardBut
 
 from bot.keyboards import (
     get_plugins_menu,
-    get_plugin_info_menu
+    get_plugin_info_menu,
+    PluginRow,
+    CBT,
+    cb_prefix,
 )
 
 logger = logging.getLogger(__name__)
@@ -18,26 +21,21 @@ router = Router()
 
 # ==================== Список плагинов ====================
 
-@router.callback_query(F.data.startswith("plugins_list:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.PLUGINS_LIST)))
 async def show_plugins_list(callback: CallbackQuery, plugin_manager, **kwargs):
     """Показать список плагинов"""
     try:
         offset = int(callback.data.split(":")[1])
         
         # Получаем плагины
-        plugins_data = []
-        for uuid, plugin in plugin_manager.plugins.items():
-            plugins_data.append({
-                "uuid": uuid,
-                "name": plugin.name,
-                "version": plugin.version,
-                "description": plugin.description,
-                "enabled": plugin.enabled
-            })
+        plugins_data = [
+            PluginRow(uuid, plugin.name, plugin.enabled, plugin.version)
+            for uuid, plugin in plugin_manager.plugins.items()
+        ]
         
         keyboard = get_plugins_menu(plugins_data, offset)
         
-        enabled_count = sum(1 for p in plugins_data if p["enabled"])
+        enabled_count = sum(1 for p in plugins_data if p.enabled)
         disabled_count = len(plugins_data) - enabled_count
         
         text = "🧩 <b>Управление плагинами</b>\n\n"
@@ -106,7 +104,7 @@ async def toggle_plugin(callback: CallbackQuery, plugin_manager, **kwargs):
             return
         
         # Переключаем
-        plugin_manager.toggle_plugin(uuid)
+        await plugin_manager.toggle_plugin_async(uuid)
         
         # Получаем обновлённый статус
         plugin = plugin_manager.plugins[uuid]
@@ -196,26 +194,21 @@ async def plugin_delete_confirm(callback: CallbackQuery, plugin_manager, **kwarg
         plugin_name = plugin.name
         
         # Удаляем плагин
-        success = plugin_manager.delete_plugin(uuid)
+        success = await plugin_manager.delete_plugin_async(uuid)
         
         if success:
             logger.info(f"Плагин {plugin_name} удалён пользователем {callback.from_user.id}")
             await callback.answer(f"✅ Плагин {plugin_name} удалён", show_alert=True)
             
             # Возвращаемся к списку плагинов - пересоздаём список вручную
-            plugins_data = []
-            for p_uuid, p in plugin_manager.plugins.items():
-                plugins_data.append({
-                    "uuid": p_uuid,
-                    "name": p.name,
-                    "version": p.version,
-                    "description": p.description,
-                    "enabled": p.enabled
-                })
+            plugins_data = [
+                PluginRow(p_uuid, p.name, p.enabled, p.version)
+                for p_uuid, p in plugin_manager.plugins.items()
+            ]
             
             keyboard = get_plugins_menu(plugins_data, offset)
             
-            enabled_count = sum(1 for p in plugins_data if p["enabled"])
+            enabled_count = sum(1 for p in plugins_data if p.enabled)
             disabled_count = len(plugins_data) - enabled_count
             
             text = "🧩 <b>Управление плагинами</b>\n\n"
@@ -15,7 +15,7 @@ from bot.keyboards.keyboards import (
     get_select_template_menu
 )
 from bot.core.templates import get_template_manager
-from bot.keyboards.keyboards import CBT
+from bot.keyboards.keyboards import CBT, cb, cb_prefix
 
 
 router = Router()
@@ -54,7 +54,7 @@ async def callback_show_templates_for_reply(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.TEMPLATES)
+@router.callback_query(F.data == cb(CBT.TEMPLATES))
 async def callback_templates_menu(callback: CallbackQuery):
     """Меню быстрых ответов"""
     await callback.answer()
@@ -77,7 +77,7 @@ async def callback_templates_menu(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data == CBT.ADD_TEMPLATE)
+@router.callback_query(F.data == cb(CBT.ADD_TEMPLATE))
 async def callback_add_template(callback: CallbackQuery, state: FSMContext):
     """Начать добавление нового быстрого ответа"""
     await callback.answer()
@@ -144,7 +144,7 @@ async def process_template_text(message: Message, state: FSMContext):
     )
 
 
-@router.callback_query(F.data.startswith(f"{CBT.TEMPLATE_DETAIL}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.TEMPLATE_DETAIL)))
 async def callback_template_detail(callback: CallbackQuery):
     """Просмотр деталей быстрого ответа"""
     await callback.answer()
@@ -173,7 +173,7 @@ async def callback_template_detail(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data.startswith(f"{CBT.DELETE_TEMPLATE}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.DELETE_TEMPLATE)))
 async def callback_delete_template(callback: CallbackQuery):
     """Удалить быстрый ответ"""
     template_id = callback.data.split(":")[1]
@@ -211,7 +211,7 @@ async def callback_delete_template(callback: CallbackQuery):
         await callback.answer("❌ Ошибка при удалении", show_alert=True)
 
 
-@router.callback_query(F.data.startswith(f"{CBT.SELECT_TEMPLATE}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.SELECT_TEMPLATE)))
 async def callback_select_template(callback: CallbackQuery, starvell=None, **kwargs):
     """Выбрать и отправить быстрый ответ пользователю"""
     await callback.answer()
@@ -254,7 +254,7 @@ async def callback_select_template(callback: CallbackQuery, starvell=None, **kwa
         await callback.answer("❌ Сервис недоступен", show_alert=True)
 
 
-@router.callback_query(F.data.startswith(f"{CBT.EDIT_TEMPLATE}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.EDIT_TEMPLATE)))
 async def callback_edit_template(callback: CallbackQuery):
     """Показать меню редактирования заготовки"""
     await callback.answer()
@@ -284,7 +284,7 @@ async def callback_edit_template(callback: CallbackQuery):
     )
 
 
-@router.callback_query(F.data.startswith(f"{CBT.EDIT_TEMPLATE_NAME}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.EDIT_TEMPLATE_NAME)))
 async def callback_edit_template_name(callback: CallbackQuery, state: FSMContext):
     """Начать редактирование названия заготовки"""
     await callback.answer()
@@ -369,7 +369,7 @@ async def process_edit_template_name(message: Message, state: FSMContext):
         )
 
 
-@router.callback_query(F.data.startswith(f"{CBT.EDIT_TEMPLATE_TEXT}:"))
+@router.callback_query(F.data.startswith(cb_prefix(CBT.EDIT_TEMPLATE_TEXT)))
 async def callback_edit_template_text(callback: CallbackQuery, state: FSMContext):
     """Начать редактирование текста заготовки"""
     await callback.answer()
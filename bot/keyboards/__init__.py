@@ -4,6 +4,10 @@
 
 from .keyboards import (
     CBT,
+    cb,
+    cb_prefix,
+    BlUser,
+    PluginRow,
     get_main_menu,
     get_main_menu_page_2,
     get_global_switches_menu,
@@ -30,6 +34,10 @@ from .plugins import plugins_list, edit_plugin, plugin_commands
 
 __all__ = [
     'CBT',
+    'cb',
+    'cb_prefix',
+    'BlUser',
+    'PluginRow',
     'get_main_menu',
     'get_main_menu_page_2',
     'get_global_switches_menu',
@@ -4,6 +4,11 @@
 
 import logging
 import os
+from enum import IntEnum
+from functools import lru_cache
+from itertools import islice
+from typing import NamedTuple
+from pydantic import ConfigDict
 from aiogram.types import (
     InlineKeyboardMarkup,
     InlineKeyboardButton,
@@ -14,100 +19,188 @@ from bot.core.config import BotConfig
 logger = logging.getLogger(__name__)
 
 
-class CBT:
-    """Типы callback кнопок"""
+class CBT(IntEnum):
+    """
+    Типы callback кнопок
+    
+    В callback_data попадает номер действия, а не имя (см. cb()),
+    поэтому новые значения добавляются только в конец, а старые не переиспользуются.
+    """
     # Главное меню
-    MAIN = "main"
-    MAIN_PAGE_2 = "main:p2"
-    GLOBAL_SWITCHES = "global"
-    NOTIFICATIONS = "notif"
-    PLUGINS = "plugins"
-    ABOUT = "about"
-    AUTO_DELIVERY = "autodelivery"
-    BLACKLIST = "blacklist"
-    TEMPLATES = "templates"
+    MAIN = 1
+    MAIN_PAGE_2 = 2
+    GLOBAL_SWITCHES = 3
+    NOTIFICATIONS = 4
+    PLUGINS = 5
+    ABOUT = 6
+    AUTO_DELIVERY = 7
+    BLACKLIST = 8
+    TEMPLATES = 9
     
     # Вторая страница главного меню
-    ORDER_CONFIRM_RESPONSE = "order_confirm_resp"
-    REVIEW_RESPONSE = "review_resp"
-    CONFIGS_MENU = "configs"
-    AUTHORIZED_USERS = "auth_users"
+    ORDER_CONFIRM_RESPONSE = 10
+    REVIEW_RESPONSE = 11
+    CONFIGS_MENU = 12
+    AUTHORIZED_USERS = 13
     
     # Кастомные команды
-    CUSTOM_COMMANDS = "custom_cmds"
-    ADD_CUSTOM_COMMAND = "custom_cmd_add"
-    TOGGLE_CUSTOM_COMMANDS = "custom_cmd_toggle"
-    CHANGE_PREFIX = "custom_cmd_prefix"
+    CUSTOM_COMMANDS = 14
+    ADD_CUSTOM_COMMAND = 15
+    TOGGLE_CUSTOM_COMMANDS = 16
+    CHANGE_PREFIX = 17
     
     # Конфиги
-    CONFIG_DOWNLOAD = "cfg_download"
-    CONFIG_UPLOAD = "cfg_upload"
+    CONFIG_DOWNLOAD = 18
+    CONFIG_UPLOAD = 19
     
     # Авторизованные пользователи
-    REMOVE_AUTH_USER = "rm_auth"
+    REMOVE_AUTH_USER = 20
     
     # Переключатели
-    SWITCH_AUTO_BUMP = "switch:auto_bump"
-    SWITCH_AUTO_DELIVERY = "switch:auto_delivery"
-    SWITCH_AUTO_RESTORE = "switch:auto_restore"
-    SWITCH_AUTO_READ = "switch:auto_read"
-    SWITCH_AUTO_TICKET = "switch:auto_ticket"
-    SWITCH_AUTO_INSTALL = "switch:auto_install"
-    SWITCH_ORDER_CONFIRM = "switch:order_confirm"
-    SWITCH_REVIEW_RESPONSE = "switch:review_resp"
-    SWITCH_USE_WATERMARK = "switch:use_watermark"
+    SWITCH_AUTO_BUMP = 21
+    SWITCH_AUTO_DELIVERY = 22
+    SWITCH_AUTO_RESTORE = 23
+    SWITCH_AUTO_READ = 24
+    SWITCH_AUTO_TICKET = 25
+    SWITCH_AUTO_INSTALL = 26
+    SWITCH_ORDER_CONFIRM = 27
+    SWITCH_REVIEW_RESPONSE = 28
+    SWITCH_USE_WATERMARK = 29
     
     # Настройки авто-тикета
-    AUTO_TICKET_SETTINGS = "autoticket_settings"
-    AUTO_TICKET_SET_INTERVAL = "autoticket_set_interval"
-    AUTO_TICKET_SET_MAX = "autoticket_set_max"
-    SWITCH_AUTO_TICKET_NOTIFY = "switch:autoticket_notify"
-    SWITCH_AUTO_TICKET_INTERNAL = "switch:auto_ticket_internal"
+    AUTO_TICKET_SETTINGS = 30
+    AUTO_TICKET_SET_INTERVAL = 31
+    AUTO_TICKET_SET_MAX = 32
+    SWITCH_AUTO_TICKET_NOTIFY = 33
+    SWITCH_AUTO_TICKET_INTERNAL = 34
     
     # Уведомления
-    NOTIF_MESSAGES = "notif:messages"
-    NOTIF_SUPPORT_MESSAGES = "notif:support"
-    NOTIF_ORDERS = "notif:orders"
-    NOTIF_RESTORE = "notif:restore"
-    NOTIF_START = "notif:start"
-    NOTIF_STOP = "notif:stop"
-    NOTIF_AUTO_TICKET = "notif:auto_ticket"
-    NOTIF_ORDER_CONFIRMED = "notif:order_confirmed"
-    NOTIF_REVIEW = "notif:review"
-    NOTIF_AUTO_RESPONSES = "notif:auto_responses"
+    NOTIF_MESSAGES = 35
+    NOTIF_SUPPORT_MESSAGES = 36
+    NOTIF_ORDERS = 37
+    NOTIF_RESTORE = 38
+    NOTIF_START = 39
+    NOTIF_STOP = 40
+    NOTIF_AUTO_TICKET = 41
+    NOTIF_ORDER_CONFIRMED = 42
+    NOTIF_REVIEW = 43
+    NOTIF_AUTO_RESPONSES = 44
     
     # Автовыдача
-    AD_LOTS_LIST = "ad_lots"
-    EDIT_AD_LOT = "ad_edit"
-    SWITCH_LOT_SETTING = "ad_switch"
+    AD_LOTS_LIST = 45
+    EDIT_AD_LOT = 46
+    SWITCH_LOT_SETTING = 47
     
     # Чёрный список
-    BL_ADD_USER = "bl_add"
-    BL_REMOVE_USER = "bl_remove"
-    BL_TOGGLE_DELIVERY = "bl:delivery"
-    BL_TOGGLE_RESPONSE = "bl:response"
-    BL_TOGGLE_MSG_NOTIF = "bl:msg_notif"
-    BL_TOGGLE_ORDER_NOTIF = "bl:order_notif"
+    BL_ADD_USER = 48
+    BL_REMOVE_USER = 49
+    BL_TOGGLE_DELIVERY = 50
+    BL_TOGGLE_RESPONSE = 51
+    BL_TOGGLE_MSG_NOTIF = 52
+    BL_TOGGLE_ORDER_NOTIF = 53
     
     # Заготовки ответов
-    ADD_TEMPLATE = "tpl_add"
-    TEMPLATE_DETAIL = "tpl_detail"
-    EDIT_TEMPLATE = "tpl_edit"
-    EDIT_TEMPLATE_NAME = "tpl_edit_name"
-    EDIT_TEMPLATE_TEXT = "tpl_edit_text"
-    DELETE_TEMPLATE = "tpl_delete"
-    SELECT_TEMPLATE = "tpl_select"
+    ADD_TEMPLATE = 54
+    TEMPLATE_DETAIL = 55
+    EDIT_TEMPLATE = 56
+    EDIT_TEMPLATE_NAME = 57
+    EDIT_TEMPLATE_TEXT = 58
+    DELETE_TEMPLATE = 59
+    SELECT_TEMPLATE = 60
     
     # Плагины
-    PLUGINS_LIST = "plugins_list"
-    EDIT_PLUGIN = "edit_plugin"
-    TOGGLE_PLUGIN = "toggle_plugin"
-    DELETE_PLUGIN = "delete_plugin"
-    CONFIRM_DELETE_PLUGIN = "confirm_delete_plugin"
-    CANCEL_DELETE_PLUGIN = "cancel_delete_plugin"
-    UPLOAD_PLUGIN = "upload_plugin"
-    PLUGIN_COMMANDS = "plugin_commands"
-    PLUGIN_SETTINGS = "plugin_settings"
+    PLUGINS_LIST = 61
+    EDIT_PLUGIN = 62
+    TOGGLE_PLUGIN = 63
+    DELETE_PLUGIN = 64
+    CONFIRM_DELETE_PLUGIN = 65
+    CANCEL_DELETE_PLUGIN = 66
+    UPLOAD_PLUGIN = 67
+    PLUGIN_COMMANDS = 68
+    PLUGIN_SETTINGS = 69
+
+
+def cb(action: CBT, *args) -> str:
+    """
+    Упаковать callback_data
+    
+    Args:
+        action: Тип callback кнопки
+        *args: Аргументы действия (uuid, offset и т.д.)
+    
+    Returns:
+        Строка вида "<номер действия>:<арг1>:<арг2>"
+    """
+    if not args:
+        return str(action.value)
+    return ":".join((str(action.value), *map(str, args)))
+
+
+def cb_prefix(action: CBT) -> str:
+    """Префикс callback_data с аргументами для фильтра F.data.startswith"""
+    return f"{action.value}:"
+
+
+class _FrozenButton(InlineKeyboardButton):
+    """Неизменяемая кнопка: попытка присвоить поле вызывает ошибку"""
+    model_config = ConfigDict(frozen=True)
+
+
+@lru_cache(maxsize=1024)
+def _btn(text: str, callback_data: str) -> InlineKeyboardButton:
+    """
+    Кнопка с callback_data из общего пула
+    
+    Одинаковые кнопки переиспользуются между рендерами меню,
+    поэтому возвращённый объект изменять нельзя - он заморожен.
+    Если нужна изменяемая кнопка, создавайте InlineKeyboardButton напрямую.
+    """
+    return _FrozenButton(text=text, callback_data=callback_data)
+
+
+# Общие строки «Назад» — одни и те же объекты для всех меню, изменять их нельзя
+_BACK_TO_MAIN_ROW = [_btn("🔙 Назад", cb(CBT.MAIN))]
+_BACK_TO_P2_ROW = [_btn("🔙 Назад", cb(CBT.MAIN_PAGE_2))]
+
+
+# Подписи переключателей {тип: (выключено, включено)}, собираются один раз при импорте
+_SWITCH_LABELS = {
+    action: (f"❌ {name}", f"✅ {name}")
+    for action, name in (
+        (CBT.SWITCH_AUTO_BUMP, "Авто-поднятие"),
+        (CBT.SWITCH_AUTO_DELIVERY, "Авто-выдача"),
+        (CBT.SWITCH_AUTO_RESTORE, "Авто-восстановление"),
+        (CBT.SWITCH_AUTO_READ, "Авто-прочтение"),
+        (CBT.SWITCH_ORDER_CONFIRM, "Ответ на подтверждение заказа"),
+        (CBT.SWITCH_REVIEW_RESPONSE, "Ответ на отзыв"),
+        (CBT.SWITCH_AUTO_TICKET, "Авто-тикет"),
+        (CBT.SWITCH_AUTO_INSTALL, "Авто-установка обновлений"),
+        (CBT.SWITCH_USE_WATERMARK, "Использовать вотермарку"),
+    )
+}
+
+_NOTIF_LABELS = {
+    action: (f"❌ {name}", f"✅ {name}")
+    for action, name in (
+        (CBT.NOTIF_MESSAGES, "Новые сообщения"),
+        (CBT.NOTIF_ORDERS, "Новые заказы"),
+        (CBT.NOTIF_SUPPORT_MESSAGES, "Сообщения от поддержки"),
+        (CBT.NOTIF_AUTO_RESPONSES, "Получена команда (автоответы)"),
+        (CBT.NOTIF_ORDER_CONFIRMED, "Подтверждение заказа"),
+        (CBT.NOTIF_RESTORE, "Восстановление лота"),
+        (CBT.NOTIF_AUTO_TICKET, "Отправка тикета"),
+        (CBT.NOTIF_REVIEW, "Ответ на отзыв"),
+        (CBT.NOTIF_START, "Запуск бота"),
+        (CBT.NOTIF_STOP, "Остановка бота"),
+    )
+}
+
+_TOGGLE_LABELS = {**_SWITCH_LABELS, **_NOTIF_LABELS}
+
+
+def _switch(action: CBT, enabled: bool) -> InlineKeyboardButton:
+    """Кнопка-переключатель с готовой подписью из _SWITCH_LABELS / _NOTIF_LABELS"""
+    return _btn(_TOGGLE_LABELS[action][bool(enabled)], cb(action))
 
 
 def bool_to_emoji(value: bool) -> str:
@@ -122,60 +215,33 @@ def get_main_menu(update_available: bool = False) -> InlineKeyboardMarkup:
     # Если доступно обновление - показываем его первой кнопкой
     if update_available:
         keyboard.append([
-            InlineKeyboardButton(
-                text="🔥 Доступно обновление!",
-                callback_data="update_now"
-            )
+            _btn("🔥 Доступно обновление!", "update_now")
         ])
     
     keyboard.extend([
         [
-            InlineKeyboardButton(
-                text="⚙️ Глобальные переключатели",
-                callback_data=CBT.GLOBAL_SWITCHES
-            ),
+            _btn("⚙️ Глобальные переключатели", cb(CBT.GLOBAL_SWITCHES)),
         ],
         [
-            InlineKeyboardButton(
-                text="🔔 Настройки уведомлений",
-                callback_data=CBT.NOTIFICATIONS
-            ),
+            _btn("🔔 Настройки уведомлений", cb(CBT.NOTIFICATIONS)),
         ],
         [
-            InlineKeyboardButton(
-                text="🤖 Настройка автоответов",
-                callback_data=CBT.CUSTOM_COMMANDS
-            ),
+            _btn("🤖 Настройка автоответов", cb(CBT.CUSTOM_COMMANDS)),
         ],
         [
-            InlineKeyboardButton(
-                text="📦 Автовыдача",
-                callback_data=CBT.AUTO_DELIVERY
-            ),
+            _btn("📦 Автовыдача", cb(CBT.AUTO_DELIVERY)),
         ],
         [
-            InlineKeyboardButton(
-                text="📋 Заготовки ответов",
-                callback_data=CBT.TEMPLATES
-            ),
+            _btn("📋 Заготовки ответов", cb(CBT.TEMPLATES)),
         ],
         [
-            InlineKeyboardButton(
-                text="🔌 Плагины",
-                callback_data=CBT.PLUGINS
-            ),
+            _btn("🔌 Плагины", cb(CBT.PLUGINS)),
         ],
         [
-            InlineKeyboardButton(
-                text="ℹ️ О боте",
-                callback_data=CBT.ABOUT
-            ),
+            _btn("ℹ️ О боте", cb(CBT.ABOUT)),
         ],
         [
-            InlineKeyboardButton(
-                text="➡️ Вперёд",
-                callback_data=CBT.MAIN_PAGE_2
-            ),
+            _btn("➡️ Вперёд", cb(CBT.MAIN_PAGE_2)),
         ],
     ])
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -188,48 +254,27 @@ def get_main_menu_page_2(update_available: bool = False) -> InlineKeyboardMarkup
     # Если доступно обновление - показываем его первой кнопкой
     if update_available:
         keyboard.append([
-            InlineKeyboardButton(
-                text="🔥 Доступно обновление!",
-                callback_data="update_now"
-            )
+            _btn("🔥 Доступно обновление!", "update_now")
         ])
     
     keyboard.extend([
         [
-            InlineKeyboardButton(
-                text="✅ Ответ на подтверждение заказа",
-                callback_data=CBT.ORDER_CONFIRM_RESPONSE
-            ),
+            _btn("✅ Ответ на подтверждение заказа", cb(CBT.ORDER_CONFIRM_RESPONSE)),
         ],
         [
-            InlineKeyboardButton(
-                text="⭐ Ответ на отзыв",
-                callback_data=CBT.REVIEW_RESPONSE
-            ),
+            _btn("⭐ Ответ на отзыв", cb(CBT.REVIEW_RESPONSE)),
         ],
         [
-            InlineKeyboardButton(
-                text="⚙️ Авто-тикеты",
-                callback_data=CBT.AUTO_TICKET_SETTINGS
-            ),
+            _btn("⚙️ Авто-тикеты", cb(CBT.AUTO_TICKET_SETTINGS)),
         ],
         [
-            InlineKeyboardButton(
-                text="📁 Конфиги",
-                callback_data=CBT.CONFIGS_MENU
-            ),
+            _btn("📁 Конфиги", cb(CBT.CONFIGS_MENU)),
         ],
         [
-            InlineKeyboardButton(
-                text="🚫 Чёрный список",
-                callback_data=CBT.BLACKLIST
-            ),
+            _btn("🚫 Чёрный список", cb(CBT.BLACKLIST)),
         ],
         [
-            InlineKeyboardButton(
-                text="👥 Авторизованные пользователи",
-                callback_data=CBT.AUTHORIZED_USERS
-            ),
+            _btn("👥 Авторизованные пользователи", cb(CBT.AUTHORIZED_USERS)),
         ],
         [
             InlineKeyboardButton(
@@ -238,10 +283,7 @@ def get_main_menu_page_2(update_available: bool = False) -> InlineKeyboardMarkup
             ),
         ],
         [
-            InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data=CBT.MAIN
-            ),
+            _btn("⬅️ Назад", cb(CBT.MAIN)),
         ],
     ])
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -258,68 +300,32 @@ def get_global_switches_menu(
     review_response: bool = False
 ) -> InlineKeyboardMarkup:
     """Меню глобальных переключателей"""
-    
-    def switch_text(name: str, enabled: bool) -> str:
-        emoji = bool_to_emoji(enabled)
-        return f"{emoji} {name}"
-    
+
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=switch_text("Авто-поднятие", auto_bump),
-                callback_data=CBT.SWITCH_AUTO_BUMP
-            ),
-            InlineKeyboardButton(
-                text=switch_text("Авто-выдача", auto_delivery),
-                callback_data=CBT.SWITCH_AUTO_DELIVERY
-            ),
+            _switch(CBT.SWITCH_AUTO_BUMP, auto_bump),
+            _switch(CBT.SWITCH_AUTO_DELIVERY, auto_delivery),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Авто-восстановление", auto_restore),
-                callback_data=CBT.SWITCH_AUTO_RESTORE
-            ),
-            InlineKeyboardButton(
-                text=switch_text("Авто-прочтение", auto_read),
-                callback_data=CBT.SWITCH_AUTO_READ
-            ),
+            _switch(CBT.SWITCH_AUTO_RESTORE, auto_restore),
+            _switch(CBT.SWITCH_AUTO_READ, auto_read),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Ответ на подтверждение заказа", order_confirm),
-                callback_data=CBT.SWITCH_ORDER_CONFIRM
-            ),
-        ],
-        [
-            InlineKeyboardButton(
-                text=switch_text("Ответ на отзыв", review_response),
-                callback_data=CBT.SWITCH_REVIEW_RESPONSE
-            ),
+            _switch(CBT.SWITCH_ORDER_CONFIRM, order_confirm),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Авто-тикет", auto_ticket),
-                callback_data=CBT.SWITCH_AUTO_TICKET
-            ),
+            _switch(CBT.SWITCH_REVIEW_RESPONSE, review_response),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Авто-установка обновлений", auto_install),
-                callback_data=CBT.SWITCH_AUTO_INSTALL
-            ),
+            _switch(CBT.SWITCH_AUTO_TICKET, auto_ticket),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Использовать вотермарку", BotConfig.USE_WATERMARK()),
-                callback_data=CBT.SWITCH_USE_WATERMARK
-            ),
+            _switch(CBT.SWITCH_AUTO_INSTALL, auto_install),
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN
-            ),
+            _switch(CBT.SWITCH_USE_WATERMARK, BotConfig.USE_WATERMARK()),
         ],
+        _BACK_TO_MAIN_ROW,
     ]
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -347,74 +353,35 @@ def get_notifications_menu(
     - auto_responses: уведомления о выполнении автоответов/команд
     - support_messages: уведомления о сообщениях от поддержки/модерации
     """
-    
-    def switch_text(name: str, enabled: bool) -> str:
-        emoji = bool_to_emoji(enabled)
-        return f"{emoji} {name}"
-    
+
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=switch_text("Новые сообщения", messages),
-                callback_data=CBT.NOTIF_MESSAGES
-            ),
-            InlineKeyboardButton(
-                text=switch_text("Новые заказы", orders),
-                callback_data=CBT.NOTIF_ORDERS
-            ),
+            _switch(CBT.NOTIF_MESSAGES, messages),
+            _switch(CBT.NOTIF_ORDERS, orders),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Сообщения от поддержки", support_messages),
-                callback_data=CBT.NOTIF_SUPPORT_MESSAGES
-            ),
+            _switch(CBT.NOTIF_SUPPORT_MESSAGES, support_messages),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Получена команда (автоответы)", auto_responses),
-                callback_data=CBT.NOTIF_AUTO_RESPONSES
-            ),
+            _switch(CBT.NOTIF_AUTO_RESPONSES, auto_responses),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Подтверждение заказа", order_confirm),
-                callback_data=CBT.NOTIF_ORDER_CONFIRMED
-            ),
+            _switch(CBT.NOTIF_ORDER_CONFIRMED, order_confirm),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Восстановление лота", restore),
-                callback_data=CBT.NOTIF_RESTORE
-            ),
-        ],
-        [
-            InlineKeyboardButton(
-                text=switch_text("Отправка тикета", auto_ticket),
-                callback_data=CBT.NOTIF_AUTO_TICKET
-            ),
+            _switch(CBT.NOTIF_RESTORE, restore),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Ответ на отзыв", review),
-                callback_data=CBT.NOTIF_REVIEW
-            ),
+            _switch(CBT.NOTIF_AUTO_TICKET, auto_ticket),
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Запуск бота", start),
-                callback_data=CBT.NOTIF_START
-            ),
-            InlineKeyboardButton(
-                text=switch_text("Остановка бота", stop),
-                callback_data=CBT.NOTIF_STOP
-            ),
+            _switch(CBT.NOTIF_REVIEW, review),
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN
-            ),
+            _switch(CBT.NOTIF_START, start),
+            _switch(CBT.NOTIF_STOP, stop),
         ],
+        _BACK_TO_MAIN_ROW,
     ]
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -435,7 +402,7 @@ def get_auto_delivery_lots_menu(lots: list, offset: int = 0) -> InlineKeyboardMa
     keyboard = []
     
     # Лоты на текущей странице
-    page_lots = lots[offset:offset + LOTS_PER_PAGE]
+    page_lots = islice(lots, offset, offset + LOTS_PER_PAGE)
     
     for i, lot in enumerate(page_lots):
         lot_index = offset + i
@@ -450,10 +417,7 @@ def get_auto_delivery_lots_menu(lots: list, offset: int = 0) -> InlineKeyboardMa
         products_info = f" ({products_count} шт.)" if products_count > 0 else ""
         
         keyboard.append([
-            InlineKeyboardButton(
-                text=f"{status} {name}{products_info}",
-                callback_data=f"ad_edit_lot:{lot_index}:{offset}"
-            )
+            _btn(f"{status} {name}{products_info}", f"ad_edit_lot:{lot_index}:{offset}")
         ])
     
     # Навигация
@@ -461,18 +425,12 @@ def get_auto_delivery_lots_menu(lots: list, offset: int = 0) -> InlineKeyboardMa
     
     if offset > 0:
         nav_row.append(
-            InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data=f"ad_lots_list:{offset - LOTS_PER_PAGE}"
-            )
+            _btn("⬅️ Назад", f"ad_lots_list:{offset - LOTS_PER_PAGE}")
         )
     
     if offset + LOTS_PER_PAGE < len(lots):
         nav_row.append(
-            InlineKeyboardButton(
-                text="Вперёд ➡️",
-                callback_data=f"ad_lots_list:{offset + LOTS_PER_PAGE}"
-            )
+            _btn("Вперёд ➡️", f"ad_lots_list:{offset + LOTS_PER_PAGE}")
         )
     
     if nav_row:
@@ -481,23 +439,12 @@ def get_auto_delivery_lots_menu(lots: list, offset: int = 0) -> InlineKeyboardMa
     # Кнопки управления
     keyboard.extend([
         [
-            InlineKeyboardButton(
-                text="➕ Добавить лот",
-                callback_data="ad_add_lot"
-            )
+            _btn("➕ Добавить лот", "ad_add_lot")
         ],
         [
-            InlineKeyboardButton(
-                text="🔄 Обновить",
-                callback_data=f"ad_lots_list:{offset}"
-            )
+            _btn("🔄 Обновить", f"ad_lots_list:{offset}")
         ],
-        [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN
-            )
-        ]
+        _BACK_TO_MAIN_ROW
     ])
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -521,52 +468,28 @@ def get_lot_edit_menu(lot_index: int, offset: int, lot: dict) -> InlineKeyboardM
     
     keyboard = [
         [
-            InlineKeyboardButton(
-                text="📝 Изменить текст ответа",
-                callback_data=f"ad_set_text:{lot_index}:{offset}"
-            )
+            _btn("📝 Изменить текст ответа", f"ad_set_text:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="📂 Загрузить файл товаров",
-                callback_data=f"ad_upload:{lot_index}:{offset}"
-            )
+            _btn("📂 Загрузить файл товаров", f"ad_upload:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Включение автовыдачи", enabled),
-                callback_data=f"ad_switch:enabled:{lot_index}:{offset}"
-            )
+            _btn(switch_text("Включение автовыдачи", enabled), f"ad_switch:enabled:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Деактивация при опустошении", disable_on_empty),
-                callback_data=f"ad_switch:disable_on_empty:{lot_index}:{offset}"
-            )
+            _btn(switch_text("Деактивация при опустошении", disable_on_empty), f"ad_switch:disable_on_empty:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Отключить авто-восстановление", disable_auto_restore),
-                callback_data=f"ad_switch:disable_auto_restore:{lot_index}:{offset}"
-            )
+            _btn(switch_text("Отключить авто-восстановление", disable_auto_restore), f"ad_switch:disable_auto_restore:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="📋 Файл продуктов",
-                callback_data=f"ad_file_info:{lot_index}:{offset}"
-            )
+            _btn("📋 Файл продуктов", f"ad_file_info:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="🗑️ Удалить лот",
-                callback_data=f"ad_delete:{lot_index}:{offset}"
-            )
+            _btn("🗑️ Удалить лот", f"ad_delete:{lot_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 К списку лотов",
-                callback_data=f"ad_lots_list:{offset}"
-            )
+            _btn("🔙 К списку лотов", f"ad_lots_list:{offset}")
         ]
     ]
     
@@ -582,10 +505,7 @@ def get_back_button(callback_data: str) -> InlineKeyboardMarkup:
     """
     keyboard = [
         [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=callback_data
-            )
+            _btn("🔙 Назад", callback_data)
         ]
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -595,7 +515,14 @@ def get_back_button(callback_data: str) -> InlineKeyboardMarkup:
 USERS_PER_PAGE = 10
 
 
-def get_blacklist_menu(blacklist: list, offset: int = 0) -> InlineKeyboardMarkup:
+class BlUser(NamedTuple):
+    """Строка списка чёрного списка"""
+    username: str
+    block_delivery: bool
+    block_response: bool
+
+
+def get_blacklist_menu(blacklist: list[BlUser], offset: int = 0) -> InlineKeyboardMarkup:
     """
     Генерирует список чёрного списка
     
@@ -606,23 +533,16 @@ def get_blacklist_menu(blacklist: list, offset: int = 0) -> InlineKeyboardMarkup
     keyboard = []
     
     # Пользователи на текущей странице
-    page_users = blacklist[offset:offset + USERS_PER_PAGE]
+    page_users = islice(blacklist, offset, offset + USERS_PER_PAGE)
     
     for i, user in enumerate(page_users):
         user_index = offset + i
-        username = user.get('username', 'Неизвестно')
-        block_delivery = user.get('block_delivery', True)
-        block_response = user.get('block_response', True)
-        
         # Иконки блокировки
-        delivery_icon = "📦❌" if block_delivery else "📦✅"
-        response_icon = "💬❌" if block_response else "💬✅"
+        delivery_icon = "📦❌" if user.block_delivery else "📦✅"
+        response_icon = "💬❌" if user.block_response else "💬✅"
         
         keyboard.append([
-            InlineKeyboardButton(
-                text=f"{delivery_icon}{response_icon} {username}",
-                callback_data=f"bl_edit:{user_index}:{offset}"
-            )
+            _btn(f"{delivery_icon}{response_icon} {user.username}", f"bl_edit:{user_index}:{offset}")
         ])
     
     # Навигация
@@ -630,18 +550,12 @@ def get_blacklist_menu(blacklist: list, offset: int = 0) -> InlineKeyboardMarkup
     
     if offset > 0:
         nav_row.append(
-            InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data=f"bl_list:{offset - USERS_PER_PAGE}"
-            )
+            _btn("⬅️ Назад", f"bl_list:{offset - USERS_PER_PAGE}")
         )
     
     if offset + USERS_PER_PAGE < len(blacklist):
         nav_row.append(
-            InlineKeyboardButton(
-                text="Вперёд ➡️",
-                callback_data=f"bl_list:{offset + USERS_PER_PAGE}"
-            )
+            _btn("Вперёд ➡️", f"bl_list:{offset + USERS_PER_PAGE}")
         )
     
     if nav_row:
@@ -650,17 +564,9 @@ def get_blacklist_menu(blacklist: list, offset: int = 0) -> InlineKeyboardMarkup
     # Кнопки управления
     keyboard.extend([
         [
-            InlineKeyboardButton(
-                text="➕ Добавить пользователя",
-                callback_data="bl_add"
-            )
+            _btn("➕ Добавить пользователя", cb(CBT.BL_ADD_USER))
         ],
-        [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN
-            )
-        ]
+        _BACK_TO_MAIN_ROW
     ])
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -683,28 +589,16 @@ def get_blacklist_user_edit_menu(user_index: int, offset: int, user: dict) -> In
     
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=switch_text("Блокировать выдачу", block_delivery),
-                callback_data=f"bl_toggle:delivery:{user_index}:{offset}"
-            )
+            _btn(switch_text("Блокировать выдачу", block_delivery), f"bl_toggle:delivery:{user_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text=switch_text("Блокировать ответы", block_response),
-                callback_data=f"bl_toggle:response:{user_index}:{offset}"
-            )
+            _btn(switch_text("Блокировать ответы", block_response), f"bl_toggle:response:{user_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="🗑️ Удалить из ЧС",
-                callback_data=f"bl_remove:{user_index}:{offset}"
-            )
+            _btn("🗑️ Удалить из ЧС", f"bl_remove:{user_index}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 К списку",
-                callback_data=f"bl_list:{offset}"
-            )
+            _btn("🔙 К списку", f"bl_list:{offset}")
         ]
     ]
     
@@ -715,7 +609,15 @@ def get_blacklist_user_edit_menu(user_index: int, offset: int, user: dict) -> In
 PLUGINS_PER_PAGE = 10
 
 
-def get_plugins_menu(plugins: list, offset: int = 0) -> InlineKeyboardMarkup:
+class PluginRow(NamedTuple):
+    """Строка списка плагинов"""
+    uuid: str
+    name: str
+    enabled: bool
+    version: str
+
+
+def get_plugins_menu(plugins: list[PluginRow], offset: int = 0) -> InlineKeyboardMarkup:
     """
     Генерирует список плагинов
     
@@ -726,23 +628,14 @@ def get_plugins_menu(plugins: list, offset: int = 0) -> InlineKeyboardMarkup:
     keyboard = []
     
     # Плагины на текущей странице
-    page_plugins = plugins[offset:offset + PLUGINS_PER_PAGE]
-    
-    for i, plugin in enumerate(page_plugins):
-        plugin_index = offset + i
-        uuid = plugin.get('uuid', '')
-        name = plugin.get('name', 'Без названия')
-        enabled = plugin.get('enabled', False)
-        version = plugin.get('version', '?')
-        
+    page_plugins = islice(plugins, offset, offset + PLUGINS_PER_PAGE)
+    
+    for plugin in page_plugins:
         # Статус
-        status = "✅" if enabled else "❌"
+        status = "✅" if plugin.enabled else "❌"
         
         keyboard.append([
-            InlineKeyboardButton(
-                text=f"{status} {name} v{version}",
-                callback_data=f"plugin_info:{uuid}:{offset}"
-            )
+            _btn(f"{status} {plugin.name} v{plugin.version}", f"plugin_info:{plugin.uuid}:{offset}")
         ])
     
     # Навигация
@@ -750,18 +643,12 @@ def get_plugins_menu(plugins: list, offset: int = 0) -> InlineKeyboardMarkup:
     
     if offset > 0:
         nav_row.append(
-            InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data=f"plugins_list:{offset - PLUGINS_PER_PAGE}"
-            )
+            _btn("⬅️ Назад", cb(CBT.PLUGINS_LIST, offset - PLUGINS_PER_PAGE))
         )
     
     if offset + PLUGINS_PER_PAGE < len(plugins):
         nav_row.append(
-            InlineKeyboardButton(
-                text="Вперёд ➡️",
-                callback_data=f"plugins_list:{offset + PLUGINS_PER_PAGE}"
-            )
+            _btn("Вперёд ➡️", cb(CBT.PLUGINS_LIST, offset + PLUGINS_PER_PAGE))
         )
     
     if nav_row:
@@ -770,17 +657,9 @@ def get_plugins_menu(plugins: list, offset: int = 0) -> InlineKeyboardMarkup:
     # Кнопки управления
     keyboard.extend([
         [
-            InlineKeyboardButton(
-                text="📤 Загрузить плагин",
-                callback_data=f"upload_plugin:{offset}"
-            )
+            _btn("📤 Загрузить плагин", cb(CBT.UPLOAD_PLUGIN, offset))
         ],
-        [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN
-            )
-        ]
+        _BACK_TO_MAIN_ROW
     ])
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -798,26 +677,17 @@ def get_templates_menu(templates: list) -> InlineKeyboardMarkup:
     # Список быстрых ответов
     for template in templates:
         keyboard.append([
-            InlineKeyboardButton(
-                text=f"📝 {template['name']}",
-                callback_data=f"{CBT.TEMPLATE_DETAIL}:{template['id']}"
-            )
+            _btn(f"📝 {template['name']}", cb(CBT.TEMPLATE_DETAIL, template['id']))
         ])
     
     # Кнопка добавления быстрого ответа
     keyboard.append([
-        InlineKeyboardButton(
-            text="➕ Добавить быстрый ответ",
-            callback_data=CBT.ADD_TEMPLATE
-        )
+        _btn("➕ Добавить быстрый ответ", cb(CBT.ADD_TEMPLATE))
     ])
     
     # Назад в главное меню
     keyboard.append([
-        InlineKeyboardButton(
-            text="🔙 Главное меню",
-            callback_data=CBT.MAIN
-        )
+        _btn("🔙 Главное меню", cb(CBT.MAIN))
     ])
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -832,22 +702,13 @@ def get_template_detail_menu(template_id: str) -> InlineKeyboardMarkup:
     """
     keyboard = [
         [
-            InlineKeyboardButton(
-                text="✏️ Редактировать",
-                callback_data=f"{CBT.EDIT_TEMPLATE}:{template_id}"
-            )
+            _btn("✏️ Редактировать", cb(CBT.EDIT_TEMPLATE, template_id))
         ],
         [
-            InlineKeyboardButton(
-                text="🗑️ Удалить",
-                callback_data=f"{CBT.DELETE_TEMPLATE}:{template_id}"
-            )
+            _btn("🗑️ Удалить", cb(CBT.DELETE_TEMPLATE, template_id))
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 К списку",
-                callback_data=CBT.TEMPLATES
-            )
+            _btn("🔙 К списку", cb(CBT.TEMPLATES))
         ]
     ]
     
@@ -863,22 +724,13 @@ def get_template_edit_menu(template_id: str) -> InlineKeyboardMarkup:
     """
     keyboard = [
         [
-            InlineKeyboardButton(
-                text="✏️ Изменить название",
-                callback_data=f"{CBT.EDIT_TEMPLATE_NAME}:{template_id}"
-            )
+            _btn("✏️ Изменить название", cb(CBT.EDIT_TEMPLATE_NAME, template_id))
         ],
         [
-            InlineKeyboardButton(
-                text="📝 Изменить текст",
-                callback_data=f"{CBT.EDIT_TEMPLATE_TEXT}:{template_id}"
-            )
+            _btn("📝 Изменить текст", cb(CBT.EDIT_TEMPLATE_TEXT, template_id))
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=f"{CBT.TEMPLATE_DETAIL}:{template_id}"
-            )
+            _btn("🔙 Назад", cb(CBT.TEMPLATE_DETAIL, template_id))
         ]
     ]
     
@@ -903,31 +755,22 @@ def get_select_template_menu(chat_id: str, templates: list = None) -> InlineKeyb
     
     if templates:
         for template in templates:
-            callback_data = f"{CBT.SELECT_TEMPLATE}:{template['id']}:{chat_id}"
+            callback_data = cb(CBT.SELECT_TEMPLATE, template['id'], chat_id)
             # Проверяем длину callback_data (лимит Telegram - 64 байта)
             if len(callback_data.encode('utf-8')) <= 64:
                 keyboard.append([
-                    InlineKeyboardButton(
-                        text=f"📝 {template['name']}",
-                        callback_data=callback_data
-                    )
+                    _btn(f"📝 {template['name']}", callback_data)
                 ])
             else:
                 # Если callback_data слишком длинный, используем только template_id
                 # Обработчик должен будет искать chat_id из контекста сообщения
                 logger.warning(f"Callback data слишком длинный ({len(callback_data.encode('utf-8'))} байт), используем короткую версию")
                 keyboard.append([
-                    InlineKeyboardButton(
-                        text=f"📝 {template['name']}",
-                        callback_data=f"{CBT.SELECT_TEMPLATE}:{template['id']}"
-                    )
+                    _btn(f"📝 {template['name']}", cb(CBT.SELECT_TEMPLATE, template['id']))
                 ])
     else:
         keyboard.append([
-            InlineKeyboardButton(
-                text="➕ Добавить быстрый ответ",
-                callback_data=CBT.ADD_TEMPLATE
-            )
+            _btn("➕ Добавить быстрый ответ", cb(CBT.ADD_TEMPLATE))
         ])
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -946,22 +789,13 @@ def get_plugin_info_menu(uuid: str, offset: int, enabled: bool) -> InlineKeyboar
     
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=status_text,
-                callback_data=f"plugin_toggle:{uuid}:{offset}"
-            )
+            _btn(status_text, f"plugin_toggle:{uuid}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="🗑️ Удалить плагин",
-                callback_data=f"plugin_delete_ask:{uuid}:{offset}"
-            )
+            _btn("🗑️ Удалить плагин", f"plugin_delete_ask:{uuid}:{offset}")
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 К списку",
-                callback_data=f"plugins_list:{offset}"
-            )
+            _btn("🔙 К списку", cb(CBT.PLUGINS_LIST, offset))
         ]
     ]
     
@@ -972,23 +806,12 @@ def get_order_confirm_response_menu(enabled: bool, text: str) -> InlineKeyboardM
     """Меню настройки ответа на подтверждение заказа"""
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=f"{'✅' if enabled else '❌'} Включено: {'Да' if enabled else 'Нет'}",
-                callback_data=CBT.SWITCH_ORDER_CONFIRM
-            )
+            _btn(f"{'✅' if enabled else '❌'} Включено: {'Да' if enabled else 'Нет'}", cb(CBT.SWITCH_ORDER_CONFIRM))
         ],
         [
-            InlineKeyboardButton(
-                text="✏️ Изменить текст ответа",
-                callback_data="edit_order_confirm_text"
-            )
+            _btn("✏️ Изменить текст ответа", "edit_order_confirm_text")
         ],
-        [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN_PAGE_2
-            )
-        ]
+        _BACK_TO_P2_ROW
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -997,23 +820,12 @@ def get_review_response_menu(enabled: bool, text: str) -> InlineKeyboardMarkup:
     """Меню настройки ответа на отзыв"""
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=f"{'✅' if enabled else '❌'} Включено: {'Да' if enabled else 'Нет'}",
-                callback_data=CBT.SWITCH_REVIEW_RESPONSE
-            )
+            _btn(f"{'✅' if enabled else '❌'} Включено: {'Да' if enabled else 'Нет'}", cb(CBT.SWITCH_REVIEW_RESPONSE))
         ],
         [
-            InlineKeyboardButton(
-                text="✏️ Изменить текст ответа",
-                callback_data="edit_review_text"
-            )
+            _btn("✏️ Изменить текст ответа", "edit_review_text")
         ],
-        [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN_PAGE_2
-            )
-        ]
+        _BACK_TO_P2_ROW
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -1027,34 +839,19 @@ def get_auto_ticket_settings_menu(
     """Меню настроек авто-тикета"""
     keyboard = [
         [
-            InlineKeyboardButton(
-                text=f"{'✅' if enabled else '❌'} Статус: {'Включено' if enabled else 'Выключено'}",
-                callback_data=CBT.SWITCH_AUTO_TICKET_INTERNAL
-            )
+            _btn(f"{'✅' if enabled else '❌'} Статус: {'Включено' if enabled else 'Выключено'}", cb(CBT.SWITCH_AUTO_TICKET_INTERNAL))
         ],
         [
-            InlineKeyboardButton(
-                text=f"⏱ Интервал: {interval} сек",
-                callback_data=CBT.AUTO_TICKET_SET_INTERVAL
-            )
+            _btn(f"⏱ Интервал: {interval} сек", cb(CBT.AUTO_TICKET_SET_INTERVAL))
         ],
         [
-            InlineKeyboardButton(
-                text=f"🔢 Макс. заказов: {max_orders}",
-                callback_data=CBT.AUTO_TICKET_SET_MAX
-            )
+            _btn(f"🔢 Макс. заказов: {max_orders}", cb(CBT.AUTO_TICKET_SET_MAX))
         ],
         [
-            InlineKeyboardButton(
-                text=f"{'🔔' if notify else '🔕'} Уведомления: {'Вкл' if notify else 'Выкл'}",
-                callback_data=CBT.SWITCH_AUTO_TICKET_NOTIFY
-            )
+            _btn(f"{'🔔' if notify else '🔕'} Уведомления: {'Вкл' if notify else 'Выкл'}", cb(CBT.SWITCH_AUTO_TICKET_NOTIFY))
         ],
         [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.GLOBAL_SWITCHES
-            )
+            _btn("🔙 Назад", cb(CBT.GLOBAL_SWITCHES))
         ]
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
@@ -1064,23 +861,12 @@ def get_configs_menu() -> InlineKeyboardMarkup:
     """Меню управления конфигами"""
     keyboard = [
         [
-            InlineKeyboardButton(
-                text="📥 Скачать конфиг",
-                callback_data=CBT.CONFIG_DOWNLOAD
-            )
+            _btn("📥 Скачать конфиг", cb(CBT.CONFIG_DOWNLOAD))
         ],
         [
-            InlineKeyboardButton(
-                text="📤 Загрузить конфиг",
-                callback_data=CBT.CONFIG_UPLOAD
-            )
+            _btn("📤 Загрузить конфиг", cb(CBT.CONFIG_UPLOAD))
         ],
-        [
-            InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=CBT.MAIN_PAGE_2
-            )
-        ]
+        _BACK_TO_P2_ROW
     ]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -1091,22 +877,11 @@ def get_authorized_users_menu(admin_ids: list) -> InlineKeyboardMarkup:
     
     for admin_id in admin_ids:
         keyboard.append([
-            InlineKeyboardButton(
-                text=f"👤 {admin_id}",
-                callback_data="empty"
-            ),
-            InlineKeyboardButton(
-                text="🗑️",
-                callback_data=f"{CBT.REMOVE_AUTH_USER}:{admin_id}"
-            )
+            _btn(f"👤 {admin_id}", "empty"),
+            _btn("🗑️", cb(CBT.REMOVE_AUTH_USER, admin_id))
         ])
     
-    keyboard.append([
-        InlineKeyboardButton(
-            text="🔙 Назад",
-            callback_data=CBT.MAIN_PAGE_2
-        )
-    ])
+    keyboard.append(_BACK_TO_P2_ROW)
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -1117,26 +892,17 @@ def get_custom_commands_menu(commands: list, page: int = 0, enabled: bool = Fals
     
     # Кнопка включения/выключения
     keyboard.append([
-        InlineKeyboardButton(
-            text=f"{'✅ Включено' if enabled else '❌ Выключено'}",
-            callback_data=CBT.TOGGLE_CUSTOM_COMMANDS
-        )
+        _btn(f"{'✅ Включено' if enabled else '❌ Выключено'}", cb(CBT.TOGGLE_CUSTOM_COMMANDS))
     ])
     
     # Кнопка изменения префикса
     keyboard.append([
-        InlineKeyboardButton(
-            text=f"🔧 Изменить префикс ({prefix})",
-            callback_data=CBT.CHANGE_PREFIX
-        )
+        _btn(f"🔧 Изменить префикс ({prefix})", cb(CBT.CHANGE_PREFIX))
     ])
     
     # Кнопка добавления команды
     keyboard.append([
-        InlineKeyboardButton(
-            text="➕ Добавить команду",
-            callback_data=CBT.ADD_CUSTOM_COMMAND
-        )
+        _btn("➕ Добавить команду", cb(CBT.ADD_CUSTOM_COMMAND))
     ])
     
     # Команды (по 5 на страницу)
@@ -1147,10 +913,7 @@ def get_custom_commands_menu(commands: list, page: int = 0, enabled: bool = Fals
     
     for cmd in page_commands:
         keyboard.append([
-            InlineKeyboardButton(
-                text=f"{prefix}{cmd['name']}",
-                callback_data=f"custom_cmd_view:{cmd['name']}"
-            )
+            _btn(f"{prefix}{cmd['name']}", f"custom_cmd_view:{cmd['name']}")
         ])
     
     # Пагинация
@@ -1159,36 +922,22 @@ def get_custom_commands_menu(commands: list, page: int = 0, enabled: bool = Fals
         
         if page > 0:
             pagination_row.append(
-                InlineKeyboardButton(
-                    text="⬅️",
-                    callback_data=f"custom_cmd_page:{page-1}"
-                )
+                _btn("⬅️", f"custom_cmd_page:{page-1}")
             )
         
         total_pages = (len(commands) + items_per_page - 1) // items_per_page
         pagination_row.append(
-            InlineKeyboardButton(
-                text=f"{page + 1}/{total_pages}",
-                callback_data="empty"
-            )
+            _btn(f"{page + 1}/{total_pages}", "empty")
         )
         
         if end < len(commands):
             pagination_row.append(
-                InlineKeyboardButton(
-                    text="➡️",
-                    callback_data=f"custom_cmd_page:{page+1}"
-                )
+                _btn("➡️", f"custom_cmd_page:{page+1}")
             )
         
         keyboard.append(pagination_row)
     
     # Кнопка назад
-    keyboard.append([
-        InlineKeyboardButton(
-            text="🔙 Назад",
-            callback_data=CBT.MAIN
-        )
-    ])
+    keyboard.append(_BACK_TO_MAIN_ROW)
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
\ No newline at end of file
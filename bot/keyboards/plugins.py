@@ -2,28 +2,30 @@
 Клавиатуры для управления плагинами
 """
 
+from itertools import islice
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from bot.keyboards.keyboards import cb
 
 
 
 def plugins_list(plugin_manager, CBT, offset: int = 0) -> InlineKeyboardMarkup:
     """Список плагинов с пагинацией"""
-    keyboard = []
+    builder = InlineKeyboardBuilder()
     
-    plugins = list(plugin_manager.plugins.values())
+    total = len(plugin_manager.plugins)
     per_page = 5
-    start = offset
-    end = min(offset + per_page, len(plugins))
+    end = min(offset + per_page, total)
     
-    for i in range(start, end):
-        plugin = plugins[i]
+    for plugin in islice(plugin_manager.plugins.values(), offset, end):
         status = "🟢" if plugin.enabled else "🔴"
-        keyboard.append([
-            InlineKeyboardButton(
-                text=f"{status} {plugin.name} v{plugin.version}",
-                callback_data=f"{CBT.EDIT_PLUGIN}:{plugin.uuid}:{offset}"
-            )
-        ])
+        builder.button(
+            text=f"{status} {plugin.name} v{plugin.version}",
+            callback_data=cb(CBT.EDIT_PLUGIN, plugin.uuid, offset)
+        )
+    builder.adjust(1)
     
     # Навигация
     nav_buttons = []
@@ -31,101 +33,91 @@ def plugins_list(plugin_manager, CBT, offset: int = 0) -> InlineKeyboardMarkup:
         nav_buttons.append(
             InlineKeyboardButton(
                 text="⬅️",
-                callback_data=f"{CBT.PLUGINS_LIST}:{offset - per_page}"
+                callback_data=cb(CBT.PLUGINS_LIST, offset - per_page)
             )
         )
-    if end < len(plugins):
+    if end < total:
         nav_buttons.append(
             InlineKeyboardButton(
                 text="➡️",
-                callback_data=f"{CBT.PLUGINS_LIST}:{offset + per_page}"
+                callback_data=cb(CBT.PLUGINS_LIST, offset + per_page)
             )
         )
     
     if nav_buttons:
-        keyboard.append(nav_buttons)
+        builder.row(*nav_buttons)
     
     # Загрузить плагин
-    keyboard.append([
+    builder.row(
         InlineKeyboardButton(
             text="⤴️ Загрузить плагин",
-            callback_data=f"{CBT.UPLOAD_PLUGIN}:{offset}"
+            callback_data=cb(CBT.UPLOAD_PLUGIN, offset)
         )
-    ])
-    
-    keyboard.append([
+    )
+    builder.row(
         InlineKeyboardButton(
             text="🔙 Назад",
-            callback_data=CBT.MAIN
+            callback_data=cb(CBT.MAIN)
         )
-    ])
+    )
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return builder.as_markup()
 
 
 def edit_plugin(plugin_data, CBT, uuid: str, offset: int, ask_delete: bool = False) -> InlineKeyboardMarkup:
     """Меню редактирования плагина"""
-    keyboard = []
+    builder = InlineKeyboardBuilder()
     
     if ask_delete:
         # Подтверждение удаления
-        keyboard.append([
-            InlineKeyboardButton(
-                text="✅ Да, удалить",
-                callback_data=f"{CBT.CONFIRM_DELETE_PLUGIN}:{uuid}:{offset}"
-            )
-        ])
-        keyboard.append([
-            InlineKeyboardButton(
-                text="❌ Отмена",
-                callback_data=f"{CBT.EDIT_PLUGIN}:{uuid}:{offset}"
-            )
-        ])
+        builder.button(
+            text="✅ Да, удалить",
+            callback_data=cb(CBT.CONFIRM_DELETE_PLUGIN, uuid, offset)
+        )
+        builder.button(
+            text="❌ Отмена",
+            callback_data=cb(CBT.EDIT_PLUGIN, uuid, offset)
+        )
     else:
         # Обычное меню
         status_text = "🔴 Включить" if not plugin_data.enabled else "🟢 Выключить"
-        keyboard.append([
-            InlineKeyboardButton(
-                text=status_text,
-                callback_data=f"{CBT.TOGGLE_PLUGIN}:{uuid}:{offset}"
-            )
-        ])
-        
-        keyboard.append([
-            InlineKeyboardButton(
-                text="🗑️ Удалить плагин",
-                callback_data=f"{CBT.DELETE_PLUGIN}:{uuid}:{offset}"
-            )
-        ])
-    
-    keyboard.append([
-        InlineKeyboardButton(
-            text="🔙 Назад",
-            callback_data=f"{CBT.PLUGINS_LIST}:{offset}"
+        builder.button(
+            text=status_text,
+            callback_data=cb(CBT.TOGGLE_PLUGIN, uuid, offset)
         )
-    ])
+        builder.button(
+            text="🗑️ Удалить плагин",
+            callback_data=cb(CBT.DELETE_PLUGIN, uuid, offset)
+        )
+    
+    builder.button(
+        text="🔙 Назад",
+        callback_data=cb(CBT.PLUGINS_LIST, offset)
+    )
+    builder.adjust(1)
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return builder.as_markup()
 
 
 def plugin_commands(plugin_data, CBT, uuid: str, offset: int) -> InlineKeyboardMarkup:
-    """Список команд плагина"""
-    keyboard = []
+    """Список команд плагина (команды не меняются после загрузки, клавиатура кэшируется на плагине)"""
+    cached = plugin_data.commands_kb.get(offset)
+    if cached is not None:
+        return cached
     
-    for cmd_name, cmd_desc in plugin_data.commands.items():
-        keyboard.append([
-            InlineKeyboardButton(
-                text=f"/{cmd_name} - {cmd_desc}",
-                callback_data="empty"
-            )
-        ])
+    builder = InlineKeyboardBuilder()
     
-    keyboard.append([
-        InlineKeyboardButton(
-            text="🔙 Назад",
-            callback_data=f"{CBT.EDIT_PLUGIN}:{uuid}:{offset}"
+    for cmd_name, cmd_desc in plugin_data.commands.items():
+        builder.button(
+            text=f"/{cmd_name} - {cmd_desc}",
+            callback_data="empty"
         )
-    ])
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
-
+    builder.button(
+        text="🔙 Назад",
+        callback_data=cb(CBT.EDIT_PLUGIN, uuid, offset)
+    )
+    builder.adjust(1)
+    
+    markup = plugin_data.commands_kb[offset] = builder.as_markup()
+    return markup
@@ -3,25 +3,51 @@
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
 import logging
 import os
 from pathlib import Path
 
 if TYPE_CHECKING:
-    from bot.plugins.manager import PluginManager
+    from bot.plugins.manager import PluginManager, PluginData
 
 from aiogram import F
-from aiogram.types import CallbackQuery, Message, FSInputFile
+from aiogram.types import CallbackQuery, Message, FSInputFile, InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
-from bot.keyboards.keyboards import CBT
+from bot.keyboards.keyboards import CBT, cb, cb_prefix
 from bot.keyboards.plugins import plugins_list, edit_plugin, plugin_commands
 
 
 logger = logging.getLogger("PluginsCP")
 
+# Префиксы callback_data, считаются один раз при импорте
+_P_LIST = cb_prefix(CBT.PLUGINS_LIST)
+_P_EDIT = cb_prefix(CBT.EDIT_PLUGIN)
+_P_COMMANDS = cb_prefix(CBT.PLUGIN_COMMANDS)
+_P_TOGGLE = cb_prefix(CBT.TOGGLE_PLUGIN)
+_P_DELETE = cb_prefix(CBT.DELETE_PLUGIN)
+_P_CANCEL_DELETE = cb_prefix(CBT.CANCEL_DELETE_PLUGIN)
+_P_CONFIRM_DELETE = cb_prefix(CBT.CONFIRM_DELETE_PLUGIN)
+_P_UPLOAD = cb_prefix(CBT.UPLOAD_PLUGIN)
+
+
+def _parse_uuid_offset(data: str) -> tuple[str, int]:
+    """Разобрать callback_data вида <тип>:<uuid>:<offset>"""
+    _, _, rest = data.partition(":")
+    uuid, _, offset = rest.partition(":")
+    return uuid, int(offset)
+
+
+@lru_cache(maxsize=32)
+def _back_kb(offset: int, text: str = "🔙 Назад") -> InlineKeyboardMarkup:
+    """Клавиатура из одной кнопки возврата к списку плагинов (кэшируется по offset)"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=text, callback_data=cb(CBT.PLUGINS_LIST, offset))]
+    ])
+
 
 class PluginUploadState(StatesGroup):
     """Состояния для загрузки плагинов"""
@@ -38,69 +64,67 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
     :param router: Router для регистрации обработчиков
     """
     
-    def check_plugin_exists(uuid: str, message: Message) -> bool:
+    async def check_plugin_exists(uuid: str, message: Message) -> Optional[PluginData]:
         """
         Проверяет существование плагина по UUID.
         Если плагин не существует - отправляет сообщение с кнопкой обновления.
         
         :param uuid: UUID плагина
         :param message: Telegram сообщение
-        :return: True если плагин существует, False если нет
+        :return: Данные плагина или None, если его нет
         """
-        if uuid not in plugin_manager.plugins:
+        plugin = plugin_manager.plugins.get(uuid)
+        if plugin is None:
             keyboard = plugins_list(plugin_manager, CBT, 0)
             text = f"❌ Плагин с UUID `{uuid}` не найден.\n\nВозможно он был удалён."
-            bot.edit_message_text(
+            await bot.edit_message_text(
                 text=text,
                 chat_id=message.chat.id,
                 message_id=message.message_id,
                 reply_markup=keyboard,
                 parse_mode="Markdown"
             )
-            return False
-        return True
+        return plugin
     
-    @router.callback_query(F.data.startswith(f"{CBT.PLUGINS_LIST}:"))
-    async def open_plugins_list(callback: CallbackQuery):
-        """Открывает список плагинов"""
-        await callback.answer()
-        
-        offset = int(callback.data.split(":")[1])
-        
-        keyboard = plugins_list(plugin_manager, CBT, offset)
+    # Отрисованные страницы списка: {offset: (text, keyboard)}, сбрасываются при смене версии состояния
+    list_cache: dict[int, tuple[str, InlineKeyboardMarkup]] = {}
+    list_cache_version = -1
+    
+    async def _render_plugins_list(message: Message, offset: int):
+        """Отрисовывает список плагинов в сообщении"""
+        nonlocal list_cache_version
         
-        total = len(plugin_manager.plugins)
-        enabled = sum(1 for p in plugin_manager.plugins.values() if p.enabled)
+        if list_cache_version != plugin_manager.state_version:
+            list_cache.clear()
+            list_cache_version = plugin_manager.state_version
         
-        text = (
-            "🧩 *Управление плагинами*\n\n"
-            f"📦 Всего плагинов: {total}\n"
-            f"✅ Активных: {enabled}\n"
-            f"⏸️ Отключённых: {total - enabled}\n\n"
-            "⚠️ *После активации/деактивации/удаления плагина "
-            "необходимо перезапустить бота!* /restart"
-        )
+        cached = list_cache.get(offset)
+        if cached is None:
+            keyboard = plugins_list(plugin_manager, CBT, offset)
+            
+            total = len(plugin_manager.plugins)
+            enabled = plugin_manager.enabled_count
+            
+            text = (
+                "🧩 *Управление плагинами*\n\n"
+                f"📦 Всего плагинов: {total}\n"
+                f"✅ Активных: {enabled}\n"
+                f"⏸️ Отключённых: {total - enabled}\n\n"
+                "⚠️ *После активации/деактивации/удаления плагина "
+                "необходимо перезапустить бота!* /restart"
+            )
+            cached = list_cache[offset] = (text, keyboard)
         
-        await callback.message.edit_text(
+        text, keyboard = cached
+        await message.edit_text(
             text=text,
             reply_markup=keyboard,
             parse_mode="Markdown"
         )
     
-    @router.callback_query(F.data.startswith(f"{CBT.EDIT_PLUGIN}:"))
-    async def open_edit_plugin_cp(callback: CallbackQuery):
-        """Открывает панель редактирования плагина"""
-        await callback.answer()
-        
-        parts = callback.data.split(":")
-        uuid, offset = parts[1], int(parts[2])
-        
-        if not check_plugin_exists(uuid, callback.message):
-            return
-        
-        plugin = plugin_manager.plugins[uuid]
-        
-        keyboard = edit_plugin(plugin, CBT, uuid, int(offset), ask_delete=False)
+    async def _render_edit(plugin, offset: int, message: Message):
+        """Отрисовывает панель редактирования плагина в сообщении"""
+        keyboard = edit_plugin(plugin, CBT, plugin.uuid, offset, ask_delete=False)
         
         text = (
             f"<b><i>{plugin.name} v{plugin.version}</i></b>\n\n"
@@ -110,39 +134,52 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
             f"<b><i>Статус:</i></b> {'✅ Активен' if plugin.enabled else '⏸️ Отключён'}\n"
         )
         
-        await callback.message.edit_text(
+        await message.edit_text(
             text=text,
             reply_markup=keyboard,
             parse_mode="HTML"
         )
     
-    @router.callback_query(F.data.startswith(f"{CBT.PLUGIN_COMMANDS}:"))
+    @router.callback_query(F.data.startswith(_P_LIST))
+    async def open_plugins_list(callback: CallbackQuery):
+        """Открывает список плагинов"""
+        await callback.answer()
+        
+        offset = int(callback.data.partition(":")[2])
+        await _render_plugins_list(callback.message, offset)
+    
+    @router.callback_query(F.data.startswith(_P_EDIT))
+    async def open_edit_plugin_cp(callback: CallbackQuery):
+        """Открывает панель редактирования плагина"""
+        await callback.answer()
+        
+        uuid, offset = _parse_uuid_offset(callback.data)
+        
+        plugin = await check_plugin_exists(uuid, callback.message)
+        if plugin is None:
+            return
+        
+        await _render_edit(plugin, offset, callback.message)
+    
+    @router.callback_query(F.data.startswith(_P_COMMANDS))
     async def open_plugin_commands(callback: CallbackQuery):
         """Открывает список команд плагина"""
         await callback.answer()
         
-        parts = callback.data.split(":")
-        uuid, offset = parts[1], int(parts[2])
+        uuid, offset = _parse_uuid_offset(callback.data)
         
-        if not check_plugin_exists(uuid, callback.message):
+        plugin = await check_plugin_exists(uuid, callback.message)
+        if plugin is None:
             return
         
-        plugin = plugin_manager.plugins[uuid]
-        
         if not plugin.commands:
             await callback.answer("У этого плагина нет команд", show_alert=True)
             return
         
-        commands_text = []
-        for cmd, desc in plugin.commands.items():
-            commands_text.append(f"/{cmd} - {desc}")
-        
-        text = (
-            f"⌨️ *Команды плагина {plugin.name}*\n\n"
-            + "\n\n".join(commands_text)
-        )
+        commands_text = "\n\n".join(f"/{cmd} - {desc}" for cmd, desc in plugin.commands.items())
+        text = f"⌨️ *Команды плагина {plugin.name}*\n\n{commands_text}"
         
-        keyboard = plugin_commands(plugin, CBT, uuid, int(offset))
+        keyboard = plugin_commands(plugin, CBT, uuid, offset)
         
         await callback.message.edit_text(
             text=text,
@@ -150,19 +187,18 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
             parse_mode="Markdown"
         )
     
-    @router.callback_query(F.data.startswith(f"{CBT.TOGGLE_PLUGIN}:"))
+    @router.callback_query(F.data.startswith(_P_TOGGLE))
     async def toggle_plugin(callback: CallbackQuery):
         """Включает/выключает плагин"""
         await callback.answer()
         
-        parts = callback.data.split(":")
-        uuid, offset = parts[1], int(parts[2])
+        uuid, offset = _parse_uuid_offset(callback.data)
         
-        if not check_plugin_exists(uuid, callback.message):
+        plugin = await check_plugin_exists(uuid, callback.message)
+        if plugin is None:
             return
         
-        plugin_manager.toggle_plugin(uuid)
-        plugin = plugin_manager.plugins[uuid]
+        await plugin_manager.toggle_plugin_async(uuid)
         
         status = "активирован" if plugin.enabled else "деактивирован"
         logger.info(
@@ -171,57 +207,50 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
         )
         
         # Обновляем меню
-        callback.data = f"{CBT.EDIT_PLUGIN}:{uuid}:{offset}"
-        await open_edit_plugin_cp(callback)
+        await _render_edit(plugin, offset, callback.message)
     
-    @router.callback_query(F.data.startswith(f"{CBT.DELETE_PLUGIN}:"))
+    @router.callback_query(F.data.startswith(_P_DELETE))
     async def ask_delete_plugin(callback: CallbackQuery):
         """Запрашивает подтверждение удаления плагина"""
         await callback.answer()
         
-        parts = callback.data.split(":")
-        uuid, offset = parts[1], int(parts[2])
+        uuid, offset = _parse_uuid_offset(callback.data)
         
-        if not check_plugin_exists(uuid, callback.message):
+        plugin = await check_plugin_exists(uuid, callback.message)
+        if plugin is None:
             return
-        
-        plugin = plugin_manager.plugins[uuid]
-        keyboard = edit_plugin(plugin, CBT, uuid, int(offset), ask_delete=True)
+        keyboard = edit_plugin(plugin, CBT, uuid, offset, ask_delete=True)
         
         await callback.message.edit_reply_markup(reply_markup=keyboard)
     
-    @router.callback_query(F.data.startswith(f"{CBT.CANCEL_DELETE_PLUGIN}:"))
+    @router.callback_query(F.data.startswith(_P_CANCEL_DELETE))
     async def cancel_delete_plugin(callback: CallbackQuery):
         """Отменяет удаление плагина"""
         await callback.answer()
         
-        parts = callback.data.split(":")
-        uuid, offset = parts[1], int(parts[2])
+        uuid, offset = _parse_uuid_offset(callback.data)
         
-        if not check_plugin_exists(uuid, callback.message):
+        plugin = await check_plugin_exists(uuid, callback.message)
+        if plugin is None:
             return
-        
-        plugin = plugin_manager.plugins[uuid]
-        keyboard = edit_plugin(plugin, CBT, uuid, int(offset), ask_delete=False)
+        keyboard = edit_plugin(plugin, CBT, uuid, offset, ask_delete=False)
         
         await callback.message.edit_reply_markup(reply_markup=keyboard)
     
-    @router.callback_query(F.data.startswith(f"{CBT.CONFIRM_DELETE_PLUGIN}:"))
+    @router.callback_query(F.data.startswith(_P_CONFIRM_DELETE))
     async def delete_plugin(callback: CallbackQuery):
         """Удаляет плагин"""
         await callback.answer()
         
-        parts = callback.data.split(":")
-        uuid, offset = parts[1], int(parts[2])
+        uuid, offset = _parse_uuid_offset(callback.data)
         
-        if not check_plugin_exists(uuid, callback.message):
+        plugin = await check_plugin_exists(uuid, callback.message)
+        if plugin is None:
             return
-        
-        plugin = plugin_manager.plugins[uuid]
         plugin_name = plugin.name
         
         # Удаляем плагин
-        if plugin_manager.delete_plugin(uuid):
+        if await plugin_manager.delete_plugin_async(uuid):
             logger.info(
                 f"Пользователь {callback.from_user.username} ({callback.from_user.id}) "
                 f"удалил плагин {plugin_name}"
@@ -230,28 +259,20 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
             await callback.answer(f"✅ Плагин {plugin_name} удалён", show_alert=True)
             
             # Возвращаемся к списку
-            callback.data = f"{CBT.PLUGINS_LIST}:{offset}"
-            await open_plugins_list(callback)
+            await _render_plugins_list(callback.message, offset)
         else:
             await callback.answer("❌ Ошибка при удалении плагина", show_alert=True)
     
-    @router.callback_query(F.data.startswith(CBT.UPLOAD_PLUGIN))
+    @router.callback_query(F.data.startswith(_P_UPLOAD))
     async def act_upload_plugin(callback: CallbackQuery, state: FSMContext):
         """Активирует режим загрузки плагина"""
         await callback.answer()
         
         # Получаем offset из callback data или используем 0 по умолчанию
-        parts = callback.data.split(":")
-        offset = int(parts[1]) if len(parts) > 1 else 0
+        _, _, offset_str = callback.data.partition(":")
+        offset = int(offset_str) if offset_str else 0
         
-        from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="❌ Отмена",
-                callback_data=f"{CBT.PLUGINS_LIST}:{offset}"
-            )]
-        ])
+        keyboard = _back_kb(offset, "❌ Отмена")
         
         await callback.message.edit_text(
             text=(
@@ -275,14 +296,7 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
         
         # Проверяем расширение файла
         if not message.document.file_name.endswith('.py'):
-            from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(
-                    text="🔙 Назад",
-                    callback_data=f"{CBT.PLUGINS_LIST}:{offset}"
-                )]
-            ])
+            keyboard = _back_kb(offset)
             
             await message.answer(
                 "❌ Неверный формат файла. Ожидается `.py` файл.",
@@ -301,14 +315,7 @@ def init_plugins_cp(bot, plugin_manager: PluginManager, router, *args):
             f"загрузил плагин {file_path}"
         )
         
-        from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(
-                text="🔙 Назад",
-                callback_data=f"{CBT.PLUGINS_LIST}:{offset}"
-            )]
-        ])
+        keyboard = _back_kb(offset)
         
         await message.answer(
             f"✅ Плагин `{message.document.file_name}` загружен!\n\n"
@@ -7,6 +7,9 @@ import sys
 import importlib.util
 import logging
 import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Callable, Any, Optional
 from uuid import UUID
 from pathlib import Path
@@ -43,6 +46,7 @@ class PluginData:
         self.delete_handler = delete_handler
         self.enabled = enabled
         self.commands: Dict[str, str] = {}  # {command: description}
+        self.commands_kb: Dict[int, Any] = {}  # Кэш клавиатуры команд {offset: InlineKeyboardMarkup}
 
 
 class PluginManager:
@@ -52,16 +56,45 @@ class PluginManager:
         self.plugins: Dict[str, PluginData] = {}
         self.plugins_dir = Path("plugins")
         self.disabled_cache = Path("storage/cache/disabled_plugins.txt")
-        self.disabled_plugins: list[str] = []
-        
-        # Хэндлеры событий
-        self.init_handlers: list[Callable] = []
-        self.start_handlers: list[Callable] = []
-        self.stop_handlers: list[Callable] = []
-        self.new_order_handlers: list[Callable] = []
-        self.new_message_handlers: list[Callable] = []
+        self.disabled_plugins: set[str] = set()
+        self._saved_disabled: Optional[tuple[str, ...]] = None  # Последнее записанное на диск содержимое
+        self._save_lock = threading.Lock()  # Запись файла может идти из нескольких потоков
+        self._disabled_seq = 0  # Номер последнего снимка disabled_plugins
+        self._written_seq = 0  # Номер последнего снимка, дошедшего до записи
+        self._enabled_count = 0  # Счётчик включённых плагинов, чтобы не пересчитывать на каждый рендер
+        self._state_version = 0  # Растёт при любом изменении состава/состояния плагинов
+        
+        # Хэндлеры событий: пары (плагин, хэндлер)
+        self.init_handlers: list[tuple[PluginData, Callable]] = []
+        self.start_handlers: list[tuple[PluginData, Callable]] = []
+        self.stop_handlers: list[tuple[PluginData, Callable]] = []
+        self.new_order_handlers: list[tuple[PluginData, Callable]] = []
+        self.new_message_handlers: list[tuple[PluginData, Callable]] = []
         self.settings_handlers: Dict[str, list[Callable]] = {}  # {uuid: [handler]}
         
+        # Хэндлеры частых событий только включённых плагинов (см. _rebuild_active_lists)
+        self.active_new_order_handlers: list[Callable] = []
+        self.active_new_message_handlers: list[Callable] = []
+        
+    @property
+    def enabled_count(self) -> int:
+        """Количество включённых плагинов"""
+        return self._enabled_count
+    
+    @property
+    def state_version(self) -> int:
+        """Версия состояния плагинов (для инвалидации кэшей отрисовки)"""
+        return self._state_version
+    
+    def _is_handler_active(self, plugin: PluginData) -> bool:
+        """Хэндлер активен, если его плагин не удалён и включён"""
+        return plugin.enabled and self.plugins.get(plugin.uuid) is plugin
+    
+    def _rebuild_active_lists(self):
+        """Пересобрать списки хэндлеров новых заказов/сообщений после изменения состояния плагинов"""
+        self.active_new_order_handlers = [h for p, h in self.new_order_handlers if self._is_handler_active(p)]
+        self.active_new_message_handlers = [h for p, h in self.new_message_handlers if self._is_handler_active(p)]
+    
     def load_disabled_plugins(self):
         """Загрузить список отключённых плагинов"""
         if not self.disabled_cache.exists():
@@ -69,19 +102,57 @@ class PluginManager:
         
         try:
             with open(self.disabled_cache, 'r', encoding='utf-8') as f:
-                self.disabled_plugins = [line.strip() for line in f if line.strip()]
+                self.disabled_plugins = {line.strip() for line in f if line.strip()}
+            self._saved_disabled = tuple(sorted(self.disabled_plugins))
         except Exception as e:
             logger.error(f"Ошибка загрузки списка отключённых плагинов: {e}")
     
+    def _snapshot_disabled(self) -> tuple[int, tuple[str, ...]]:
+        """Снять отсортированную копию отключённых плагинов с порядковым номером.
+        Вызывается в потоке event loop - там же, где меняется disabled_plugins"""
+        self._disabled_seq += 1
+        return self._disabled_seq, tuple(sorted(self.disabled_plugins))
+    
+    def _write_disabled(self, seq: int, snapshot: tuple[str, ...]):
+        """Записать снимок на диск (атомарно, только при изменении; можно из любого потока).
+        Снимок старше уже записанного пропускается, чтобы не откатить файл к старому состоянию"""
+        with self._save_lock:
+            if seq <= self._written_seq:
+                return
+            self._written_seq = seq
+            if snapshot == self._saved_disabled:
+                return
+            
+            self.disabled_cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = None
+            
+            try:
+                # У каждой записи свой временный файл в той же папке, os.replace атомарно подменяет кэш
+                with tempfile.NamedTemporaryFile(
+                    'w', encoding='utf-8', dir=self.disabled_cache.parent,
+                    prefix='disabled_plugins.', suffix='.tmp', delete=False
+                ) as f:
+                    tmp_path = f.name
+                    f.write('\n'.join(snapshot))
+                os.replace(tmp_path, self.disabled_cache)
+                self._saved_disabled = snapshot
+            except Exception as e:
+                logger.error(f"Ошибка сохранения списка отключённых плагинов: {e}")
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+    
     def save_disabled_plugins(self):
         """Сохранить список отключённых плагинов"""
-        self.disabled_cache.parent.mkdir(parents=True, exist_ok=True)
-        
-        try:
-            with open(self.disabled_cache, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.disabled_plugins))
-        except Exception as e:
-            logger.error(f"Ошибка сохранения списка отключённых плагинов: {e}")
+        self._write_disabled(*self._snapshot_disabled())
+    
+    async def save_disabled_plugins_async(self):
+        """Сохранить список отключённых плагинов, не блокируя event loop.
+        Снимок берётся здесь, в поток уходит только запись файла"""
+        seq, snapshot = self._snapshot_disabled()
+        await asyncio.to_thread(self._write_disabled, seq, snapshot)
     
     @staticmethod
     def is_uuid_valid(uuid_str: str) -> bool:
@@ -96,15 +167,39 @@ class PluginManager:
     def is_plugin_enabled(file_path: Path) -> bool:
         """Проверить, не отключён ли плагин через # noplug"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline().strip()
-                if first_line.startswith('#') and 'noplug' in first_line:
-                    return False
+            # Читаем только начало файла в байтах, без текстовой обёртки и декодирования
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                head = os.read(fd, 256)
+            finally:
+                os.close(fd)
+            
+            first_line = head.split(b'\n', 1)[0].strip()
+            if first_line.startswith(b'#') and b'noplug' in first_line:
+                return False
         except Exception as e:
             logger.error(f"Ошибка чтения файла {file_path}: {e}")
             return False
         return True
     
+    def _scan_enabled_files(self, plugin_files: list[Path]) -> list[Path]:
+        """
+        Отобрать файлы плагинов без # noplug
+        
+        Первые строки файлов читаются параллельно в пуле потоков,
+        сами модули потом загружаются последовательно.
+        """
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            flags = list(pool.map(self.is_plugin_enabled, plugin_files))
+        
+        enabled_files = []
+        for file_path, enabled in zip(plugin_files, flags):
+            if enabled:
+                enabled_files.append(file_path)
+            else:
+                logger.debug(f"Плагин {file_path.name} отключён через # noplug")
+        return enabled_files
+    
     def load_plugin_module(self, file_path: Path) -> tuple[ModuleType, dict]:
         """
         Загрузить модуль плагина и извлечь данные
@@ -155,8 +250,12 @@ class PluginManager:
         # Загружаем список отключённых плагинов
         self.load_disabled_plugins()
         
-        # Находим все .py файлы
-        plugin_files = list(self.plugins_dir.glob("*.py"))
+        # Находим все .py файлы за один проход по каталогу
+        with os.scandir(self.plugins_dir) as entries:
+            plugin_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.py') and entry.is_file()
+            ]
         
         if not plugin_files:
             logger.info("🧩 Плагины не обнаружены")
@@ -166,13 +265,8 @@ class PluginManager:
         sys.path.insert(0, str(self.plugins_dir))
         
         loaded_count = 0
-        for file_path in plugin_files:
+        for file_path in self._scan_enabled_files(plugin_files):
             try:
-                # Проверяем # noplug
-                if not self.is_plugin_enabled(file_path):
-                    logger.debug(f"Плагин {file_path.name} отключён через # noplug")
-                    continue
-                
                 # Загружаем модуль
                 module, data = self.load_plugin_module(file_path)
                 
@@ -204,6 +298,8 @@ class PluginManager:
                 
                 self.plugins[uuid] = plugin
                 loaded_count += 1
+                if enabled:
+                    self._enabled_count += 1
                 
                 status = "✅" if enabled else "⏸️"
                 logger.info(f"{status} Плагин {data['NAME']} v{data['VERSION']} загружен")
@@ -212,6 +308,8 @@ class PluginManager:
                 logger.error(f"❌ Ошибка загрузки плагина {file_path.name}: {e}")
                 logger.debug("TRACEBACK", exc_info=True)
         
+        self._state_version += 1
+        self._rebuild_active_lists()
         logger.info(f"📦 Загружено плагинов: {loaded_count}/{len(plugin_files)}")
     
     def register_handlers(self, router=None):
@@ -229,28 +327,23 @@ class PluginManager:
             # Регистрируем хэндлеры
             if hasattr(module, 'BIND_TO_INIT'):
                 for handler in module.BIND_TO_INIT:
-                    handler.plugin_uuid = uuid
-                    self.init_handlers.append(handler)
+                    self.init_handlers.append((plugin, handler))
             
             if hasattr(module, 'BIND_TO_START'):
                 for handler in module.BIND_TO_START:
-                    handler.plugin_uuid = uuid
-                    self.start_handlers.append(handler)
+                    self.start_handlers.append((plugin, handler))
             
             if hasattr(module, 'BIND_TO_STOP'):
                 for handler in module.BIND_TO_STOP:
-                    handler.plugin_uuid = uuid
-                    self.stop_handlers.append(handler)
+                    self.stop_handlers.append((plugin, handler))
             
             if hasattr(module, 'BIND_TO_NEW_ORDER'):
                 for handler in module.BIND_TO_NEW_ORDER:
-                    handler.plugin_uuid = uuid
-                    self.new_order_handlers.append(handler)
+                    self.new_order_handlers.append((plugin, handler))
             
             if hasattr(module, 'BIND_TO_NEW_MESSAGE'):
                 for handler in module.BIND_TO_NEW_MESSAGE:
-                    handler.plugin_uuid = uuid
-                    self.new_message_handlers.append(handler)
+                    self.new_message_handlers.append((plugin, handler))
             
             if hasattr(module, 'BIND_TO_SETTINGS_PAGE'):
                 self.settings_handlers[uuid] = module.BIND_TO_SETTINGS_PAGE
@@ -290,17 +383,16 @@ class PluginManager:
                         logger.debug(f"Text handler {handler_name} зарегистрирован из плагина {plugin.name}")
             
             logger.debug(f"Хэндлеры плагина {plugin.name} зарегистрированы")
+        
+        self._rebuild_active_lists()
     
-    async def run_handlers(self, handlers: list[Callable], *args):
+    async def run_handlers(self, handlers: list[tuple[PluginData, Callable]], *args):
         """Выполнить список хэндлеров (поддерживает sync и async)"""
-        for handler in handlers:
+        for plugin, handler in handlers:
+            if not plugin.enabled:
+                continue
+            
             try:
-                # Проверяем, включён ли плагин
-                plugin_uuid = getattr(handler, 'plugin_uuid', None)
-                if plugin_uuid and plugin_uuid in self.plugins:
-                    if not self.plugins[plugin_uuid].enabled:
-                        continue
-                
                 # Проверяем, является ли хэндлер асинхронным
                 if asyncio.iscoroutinefunction(handler):
                     await handler(*args)
@@ -310,28 +402,45 @@ class PluginManager:
                 logger.error(f"Ошибка выполнения хэндлера {handler.__name__}: {e}")
                 logger.debug("TRACEBACK", exc_info=True)
     
-    def toggle_plugin(self, uuid: str):
-        """Включить/выключить плагин"""
-        if uuid not in self.plugins:
+    def _flip_enabled(self, uuid: str) -> bool:
+        """Переключить состояние плагина в памяти (без записи на диск)"""
+        plugin = self.plugins.get(uuid)
+        if plugin is None:
             return False
         
-        plugin = self.plugins[uuid]
         plugin.enabled = not plugin.enabled
+        self._enabled_count += 1 if plugin.enabled else -1
+        self._state_version += 1
         
-        if plugin.enabled and uuid in self.disabled_plugins:
-            self.disabled_plugins.remove(uuid)
-        elif not plugin.enabled and uuid not in self.disabled_plugins:
-            self.disabled_plugins.append(uuid)
+        if plugin.enabled:
+            self.disabled_plugins.discard(uuid)
+        else:
+            self.disabled_plugins.add(uuid)
+        
+        self._rebuild_active_lists()
+        return True
+    
+    def toggle_plugin(self, uuid: str):
+        """Включить/выключить плагин"""
+        if not self._flip_enabled(uuid):
+            return False
         
         self.save_disabled_plugins()
         return True
     
-    def delete_plugin(self, uuid: str) -> bool:
-        """Удалить плагин"""
-        if uuid not in self.plugins:
+    async def toggle_plugin_async(self, uuid: str) -> bool:
+        """Включить/выключить плагин (состояние меняется в event loop, в поток уходит только запись файла)"""
+        if not self._flip_enabled(uuid):
             return False
         
-        plugin = self.plugins[uuid]
+        await self.save_disabled_plugins_async()
+        return True
+    
+    def _before_delete(self, uuid: str) -> Optional[PluginData]:
+        """Найти удаляемый плагин и вызвать его хэндлер удаления"""
+        plugin = self.plugins.get(uuid)
+        if plugin is None:
+            return None
         
         # Вызываем хэндлер удаления, если есть
         if plugin.delete_handler:
@@ -340,6 +449,39 @@ class PluginManager:
             except Exception as e:
                 logger.error(f"Ошибка выполнения хэндлера удаления плагина {plugin.name}: {e}")
         
+        return plugin
+    
+    def _forget_plugin(self, uuid: str, plugin: PluginData) -> bool:
+        """Убрать плагин из менеджера после удаления файла.
+        Возвращает True, если изменился список отключённых плагинов"""
+        del self.plugins[uuid]
+        if plugin.enabled:
+            self._enabled_count -= 1
+        self._state_version += 1
+        
+        # Отпускаем ссылки на модуль плагина, чтобы он мог быть собран
+        for name in ('init', 'start', 'stop', 'new_order', 'new_message'):
+            attr = f"{name}_handlers"
+            setattr(self, attr, [(p, h) for p, h in getattr(self, attr) if p is not plugin])
+        self.settings_handlers.pop(uuid, None)
+        sys.modules.pop(f"plugins.{Path(plugin.path).stem}", None)
+        plugin.module = None
+        plugin.commands_kb.clear()
+        self._rebuild_active_lists()
+        logger.info(f"🗑️ Плагин {plugin.name} удалён")
+        
+        # Удаляем из отключённых, если был там
+        if uuid in self.disabled_plugins:
+            self.disabled_plugins.remove(uuid)
+            return True
+        return False
+    
+    def delete_plugin(self, uuid: str) -> bool:
+        """Удалить плагин"""
+        plugin = self._before_delete(uuid)
+        if plugin is None:
+            return False
+        
         # Удаляем файл
         try:
             os.remove(plugin.path)
@@ -347,13 +489,23 @@ class PluginManager:
             logger.error(f"Ошибка удаления файла плагина {plugin.path}: {e}")
             return False
         
-        # Удаляем из словаря
-        del self.plugins[uuid]
-        
-        # Удаляем из отключённых, если был там
-        if uuid in self.disabled_plugins:
-            self.disabled_plugins.remove(uuid)
+        if self._forget_plugin(uuid, plugin):
             self.save_disabled_plugins()
+        return True
+    
+    async def delete_plugin_async(self, uuid: str) -> bool:
+        """Удалить плагин (состояние меняется в event loop, в поток уходят только файловые операции)"""
+        plugin = self._before_delete(uuid)
+        if plugin is None:
+            return False
         
-        logger.info(f"🗑️ Плагин {plugin.name} удалён")
+        # Удаляем файл
+        try:
+            await asyncio.to_thread(os.remove, plugin.path)
+        except Exception as e:
+            logger.error(f"Ошибка удаления файла плагина {plugin.path}: {e}")
+            return False
+        
+        if self._forget_plugin(uuid, plugin):
+            await self.save_disabled_plugins_async()
         return True
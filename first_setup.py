@@ -4,38 +4,49 @@
 
 import os
 import sys
-import configparser
-import hashlib
 import time
 from pathlib import Path
 
-try:
-    from colorama import Fore, Style, init, Back
-    init(autoreset=True)
-    HAS_COLOR = True
-except ImportError:
-    # Если colorama не установлена
+HAS_COLOR = False
+if sys.stdout.isatty():
+    try:
+        from colorama import Fore, Style, init, Back
+        init(autoreset=True)
+        HAS_COLOR = True
+    except ImportError:
+        pass
+
+if not HAS_COLOR:
+    # Если colorama не установлена или вывод идёт не в терминал
     class Fore:
         CYAN = MAGENTA = RED = BLUE = GREEN = YELLOW = WHITE = LIGHTBLUE_EX = LIGHTGREEN_EX = ""
     class Style:
-        BRIGHT = RESET_ALL = DIM = ""
+        BRIGHT = RESET_ALL = DIM = NORMAL = ""
     class Back:
         BLACK = ""
-    HAS_COLOR = False
 
 
 # ═══════════════════════════════════════════════════════════
 # 🎨 Стилизация
 # ═══════════════════════════════════════════════════════════
 
+# Отрезки рамок и отступы, чтобы не собирать их заново в каждой строке
+_EQ70 = '═' * 70
+_DASH68 = '─' * 68
+_SP = [' ' * i for i in range(80)]
+
+
 def clear():
     """Очистить экран"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt' and not HAS_COLOR:
+        # Без colorama старая консоль Windows не понимает ANSI-коды
+        os.system('cls')
+        return
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
-def print_logo():
-    """Красивый ASCII логотип"""
-    logo = f"""
+_LOGO = f"""
 {Fore.CYAN}{Style.BRIGHT}
     ███████╗████████╗ █████╗ ██████╗ ██╗   ██╗███████╗██╗     ██╗     
     ██╔════╝╚══██╔══╝██╔══██╗██╔══██╗██║   ██║██╔════╝██║     ██║     
@@ -44,38 +55,65 @@ def print_logo():
     ███████║   ██║   ██║  ██║██║  ██║ ╚████╔╝ ███████╗███████╗███████╗
     ╚══════╝   ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═╝  ╚═══╝  ╚══════╝╚══════╝╚══════╝
 {Style.RESET_ALL}"""
-    print(logo)
 
 
-def print_header(step=None, total=4):
-    """Красивый заголовок с индикатором прогресса"""
-    clear()
-    print_logo()
-    
+def _write(*lines):
+    """Вывести несколько строк одной записью в stdout (как print для каждой строки)"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def print_logo():
+    """Красивый ASCII логотип"""
+    _write(_LOGO)
+
+
+def _build_header(step, total):
+    """Собрать рамку заголовка (приветствие, если step не задан)"""
     if step:
         # Индикатор прогресса
         progress = "█" * step + "░" * (total - step)
         percentage = int((step / total) * 100)
         
-        print(f"\n{Fore.CYAN}╔{'═' * 70}╗")
-        print(f"║{' ' * 24}{Fore.WHITE}МАСТЕР УСТАНОВКИ{Fore.CYAN}{' ' * 30}║")
-        print(f"║{' ' * 70}║")
-        print(f"║  {Fore.LIGHTBLUE_EX}Прогресс: {Fore.GREEN}{progress}{Fore.CYAN} {percentage}% {Fore.WHITE}(Шаг {step} из {total}){Fore.CYAN}{' ' * (70 - 45 - len(str(step)) - len(str(total)))}║")
-        print(f"╚{'═' * 70}╝{Style.RESET_ALL}\n")
+        lines = [
+            f"\n{Fore.CYAN}╔{_EQ70}╗",
+            f"║{_SP[24]}{Fore.WHITE}МАСТЕР УСТАНОВКИ{Fore.CYAN}{_SP[30]}║",
+            f"║{_SP[70]}║",
+            f"║  {Fore.LIGHTBLUE_EX}Прогресс: {Fore.GREEN}{progress}{Fore.CYAN} {percentage}% {Fore.WHITE}(Шаг {step} из {total}){Fore.CYAN}{' ' * (70 - 45 - len(str(step)) - len(str(total)))}║",
+            f"╚{_EQ70}╝{Style.RESET_ALL}\n",
+        ]
     else:
-        print(f"\n{Fore.CYAN}╔{'═' * 70}╗")
-        print(f"║{' ' * 20}{Fore.WHITE}{Style.BRIGHT}ДОБРО ПОЖАЛОВАТЬ В STARVELL CARDINAL{Fore.CYAN}{Style.NORMAL}{' ' * 15}║")
-        print(f"║{' ' * 25}{Fore.WHITE}Made by @kapystus{Fore.CYAN}{' ' * 29}║")
-        print(f"╚{'═' * 70}╝{Style.RESET_ALL}\n")
+        lines = [
+            f"\n{Fore.CYAN}╔{_EQ70}╗",
+            f"║{_SP[20]}{Fore.WHITE}{Style.BRIGHT}ДОБРО ПОЖАЛОВАТЬ В STARVELL CARDINAL{Fore.CYAN}{Style.NORMAL}{_SP[15]}║",
+            f"║{_SP[25]}{Fore.WHITE}Made by @kapystus{Fore.CYAN}{_SP[29]}║",
+            f"╚{_EQ70}╝{Style.RESET_ALL}\n",
+        ]
+    return "\n".join(lines)
+
+
+# Заголовки мастера (4 шага) собираются один раз при импорте, индекс 0 - приветствие
+_HEADERS = [_build_header(step, 4) for step in range(5)]
+
+
+def print_header(step=None, total=4):
+    """Красивый заголовок с индикатором прогресса"""
+    clear()
+    
+    if total == 4 and (step or 0) < len(_HEADERS):
+        header = _HEADERS[step or 0]
+    else:
+        header = _build_header(step, total)
+    _write(_LOGO, header)
 
 
 def print_box(title, lines, color=Fore.CYAN):
     """Красивая рамка с текстом"""
-    width = 68
-    print(f"\n{color}┌─ {Fore.WHITE}{Style.BRIGHT}{title}{Style.RESET_ALL}")
-    for line in lines:
-        print(f"{color}│ {Fore.WHITE}{line}{Style.RESET_ALL}")
-    print(f"{color}└{'─' * width}{Style.RESET_ALL}\n")
+    _write(
+        f"\n{color}┌─ {Fore.WHITE}{Style.BRIGHT}{title}{Style.RESET_ALL}",
+        *(f"{color}│ {Fore.WHITE}{line}{Style.RESET_ALL}" for line in lines),
+        f"{color}└{_DASH68}{Style.RESET_ALL}\n"
+    )
 
 
 def print_info(text, icon="ℹ"):
@@ -135,11 +173,22 @@ def ask_yes_no(prompt, default=True):
 
 def animate_dots(text, duration=1):
     """Анимация точек"""
-    print(f"{Fore.CYAN}{text}", end="", flush=True)
+    done = f" {Fore.GREEN}✓{Style.RESET_ALL}\n"
+    if duration <= 0:
+        # Без анимации - вся строка одной записью
+        sys.stdout.write(f"{Fore.CYAN}{text}...{done}")
+        sys.stdout.flush()
+        return
+    
+    sys.stdout.write(f"{Fore.CYAN}{text}")
+    sys.stdout.flush()
+    step = duration / 3
     for _ in range(3):
-        time.sleep(duration / 3)
-        print(".", end="", flush=True)
-    print(f" {Fore.GREEN}✓{Style.RESET_ALL}")
+        time.sleep(step)
+        sys.stdout.write(".")
+        sys.stdout.flush()
+    sys.stdout.write(done)
+    sys.stdout.flush()
     time.sleep(0.3)
 
 
@@ -149,19 +198,26 @@ def animate_dots(text, duration=1):
 
 def run_setup():
     """Запустить установку"""
+    # Нужны только мастеру установки, который запускается один раз
+    import configparser
+    import hashlib
+    import io
+    
     config = configparser.ConfigParser()
     
     # ═══ Приветствие ═══
     print_header()
     
-    print(f"{Fore.CYAN}╔{'═' * 70}╗")
-    print(f"║{' ' * 70}║")
-    print(f"║{' ' * 15}{Fore.WHITE}{Style.BRIGHT}🚀 Мастер быстрой настройки бота 🚀{Fore.CYAN}{Style.NORMAL}{' ' * 18}║")
-    print(f"║{' ' * 70}║")
-    print(f"║{' ' * 10}{Fore.WHITE}Сейчас мы за 4 простых шага настроим ваш бот{Fore.CYAN}{' ' * 16}║")
-    print(f"║{' ' * 15}{Fore.WHITE}Это займёт всего пару минут!{Fore.CYAN}{' ' * 27}║")
-    print(f"║{' ' * 70}║")
-    print(f"╚{'═' * 70}╝{Style.RESET_ALL}\n")
+    _write(
+        f"{Fore.CYAN}╔{_EQ70}╗",
+        f"║{_SP[70]}║",
+        f"║{_SP[15]}{Fore.WHITE}{Style.BRIGHT}🚀 Мастер быстрой настройки бота 🚀{Fore.CYAN}{Style.NORMAL}{_SP[18]}║",
+        f"║{_SP[70]}║",
+        f"║{_SP[10]}{Fore.WHITE}Сейчас мы за 4 простых шага настроим ваш бот{Fore.CYAN}{_SP[16]}║",
+        f"║{_SP[15]}{Fore.WHITE}Это займёт всего пару минут!{Fore.CYAN}{_SP[27]}║",
+        f"║{_SP[70]}║",
+        f"╚{_EQ70}╝{Style.RESET_ALL}\n"
+    )
     
     print_info("Вы можете в любой момент прервать установку нажав Ctrl+C")
     print_info("Все настройки позже можно изменить через бота\n")
@@ -172,7 +228,6 @@ def run_setup():
     # ШАГ 1: Telegram Bot Token
     # ═══════════════════════════════════════════════════════════
     print_header(step=1)
-    print_header(step=1)
     
     print_box(
         "📱 ШАГ 1: Telegram Bot Token",
@@ -232,11 +287,20 @@ def run_setup():
             print_error("Слишком короткий! Минимум 8 символов\n")
             continue
         
-        if password.lower() == password or password.upper() == password:
+        # Один проход по паролю: проверяем все классы символов сразу
+        has_lower = has_upper = has_digit = False
+        for c in password:
+            has_lower = has_lower or c.islower()
+            has_upper = has_upper or c.isupper()
+            has_digit = has_digit or c.isdigit()
+            if has_lower and has_upper and has_digit:
+                break
+        
+        if not (has_lower and has_upper):
             print_error("Нужны и заглавные, и строчные буквы!\n")
             continue
         
-        if not any(c.isdigit() for c in password):
+        if not has_digit:
             print_error("Нужна хотя бы одна цифра!\n")
             continue
         
@@ -251,8 +315,10 @@ def run_setup():
         print_success("Пароль принят!\n")
         break
     
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
+    # Алгоритм записывается рядом с хешем, чтобы бот знал, чем проверять пароль
+    password_hash = hashlib.blake2b(password.encode(), digest_size=32, person=b'starvell').hexdigest()
     config['Telegram']['secretkeyhash'] = password_hash
+    config['Telegram']['keyalgo'] = 'blake2b'
     config['Telegram']['adminIds'] = '[]'
     config['Telegram']['enabled'] = '1'
     
@@ -373,8 +439,19 @@ def run_setup():
         config_path = Path("configs/_main.cfg")
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, 'w', encoding='utf-8') as f:
-            config.write(f)
+        # Собираем конфиг в памяти и подменяем файл атомарно, чтобы сбой не оставил его наполовину записанным
+        buf = io.StringIO()
+        config.write(buf)
+        tmp_path = config_path.with_suffix('.cfg.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(buf.getvalue().encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())  # Данные на диске до подмены файла
+            os.replace(tmp_path, config_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
         print_success("Конфигурация сохранена!\n")
         time.sleep(0.5)
@@ -389,11 +466,13 @@ def run_setup():
     clear()
     print_logo()
     
-    print(f"\n{Fore.GREEN}{Style.BRIGHT}╔{'═' * 70}╗")
-    print(f"║{' ' * 70}║")
-    print(f"║{' ' * 20}🎉 УСТАНОВКА ЗАВЕРШЕНА УСПЕШНО! 🎉{' ' * 19}║")
-    print(f"║{' ' * 70}║")
-    print(f"╚{'═' * 70}╝{Style.RESET_ALL}\n")
+    _write(
+        f"\n{Fore.GREEN}{Style.BRIGHT}╔{_EQ70}╗",
+        f"║{_SP[70]}║",
+        f"║{_SP[20]}🎉 УСТАНОВКА ЗАВЕРШЕНА УСПЕШНО! 🎉{_SP[19]}║",
+        f"║{_SP[70]}║",
+        f"╚{_EQ70}╝{Style.RESET_ALL}\n"
+    )
     
     print_box(
         "📋 Сводка установки",
@@ -425,11 +504,13 @@ def run_setup():
         color=Fore.CYAN
     )
     
-    print(f"{Fore.CYAN}╔{'═' * 70}╗")
-    print(f"║{' ' * 18}{Fore.WHITE}Документация: {Fore.GREEN}docs/PLUGINS_API.md{Fore.CYAN}{' ' * 22}║")
-    print(f"║{' ' * 20}{Fore.WHITE}GitHub: {Fore.GREEN}github.com/Hackep1551{Fore.CYAN}{' ' * 21}║")
-    print(f"║{' ' * 18}{Fore.WHITE}Telegram: {Fore.GREEN}@kapystus{Fore.CYAN}{' ' * 33}║")
-    print(f"╚{'═' * 70}╝{Style.RESET_ALL}\n")
+    _write(
+        f"{Fore.CYAN}╔{_EQ70}╗",
+        f"║{_SP[18]}{Fore.WHITE}Документация: {Fore.GREEN}docs/PLUGINS_API.md{Fore.CYAN}{_SP[22]}║",
+        f"║{_SP[20]}{Fore.WHITE}GitHub: {Fore.GREEN}github.com/Hackep1551{Fore.CYAN}{_SP[21]}║",
+        f"║{_SP[18]}{Fore.WHITE}Telegram: {Fore.GREEN}@kapystus{Fore.CYAN}{_SP[33]}║",
+        f"╚{_EQ70}╝{Style.RESET_ALL}\n"
+    )
     
     print(f"{Fore.YELLOW}{Style.BRIGHT}Спасибо за установку Starvell Cardinal!{Style.RESET_ALL}\n")
     
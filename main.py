@@ -5,6 +5,9 @@ Starvell Bot - главный файл запуска
 import os
 import sys
 import time
+import queue
+import atexit
+import threading
 import logging
 import asyncio
 from pathlib import Path
@@ -35,51 +38,70 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': 'C'
     }
     
-    def format(self, record):
-        # Цвет для уровня
-        levelname_color = self.COLORS.get(record.levelname, self.RESET)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Готовые префиксы уровней: цвет + [сокращение] + сброс
+        self._level_prefix = {
+            level: f"{color}{self.BOLD}[{self.LEVEL_ABBR[level]}]{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
+        self._default_prefix = f"{self.RESET}{self.BOLD}[?]{self.RESET}"
         
+        # Строка времени пересчитывается не чаще раза в секунду
+        self._cached_second = None
+        self._cached_time = ""
+    
+    def format(self, record):
         # Форматируем время
-        time_str = self.formatTime(record, '%H:%M:%S')
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = self.formatTime(record, '%H:%M:%S')
+            self._cached_second = second
         
-        # Сокращённый уровень
-        level_abbr = self.LEVEL_ABBR.get(record.levelname, '?')
-        level_str = f"{levelname_color}{self.BOLD}[{level_abbr}]{self.RESET}"
+        level_str = self._level_prefix.get(record.levelname, self._default_prefix)
         
-        # Сообщение
-        message = record.getMessage()
-        
-        return f"{time_str} {level_str} {message}"
+        return f"{self._cached_time} {level_str} {record.getMessage()}"
 
 
-# Создаём папку для логов если её нет
-from pathlib import Path
-from logging.handlers import RotatingFileHandler
-logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
-
-# Настройка цветного логирования
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setFormatter(ColoredFormatter())
-
-# Ротация логов: макс 5MB на файл, до 10 бэкапов (bot.log, bot.log.1, bot.log.2, ...)
-file_handler = RotatingFileHandler(
-    'logs/bot.log', 
-    encoding='utf-8',
-    maxBytes=5*1024*1024,  # 5MB
-    backupCount=10
-)
-file_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-))
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-logging.basicConfig(
-    level=logging.INFO,
-    handlers=[console_handler, file_handler]
-)
 
-# Отключаем verbose логи aiogram
-logging.getLogger('aiogram.event').setLevel(logging.WARNING)
+def setup_logging():
+    """Настроить логирование (вызывается только при запуске, а не при импорте модуля)"""
+    # Создаём папку для логов если её нет
+    logs_dir = Path("logs")
+    logs_dir.mkdir(exist_ok=True)
+    
+    # Настройка цветного логирования
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(ColoredFormatter())
+    
+    # Ротация логов: макс 5MB на файл, до 10 бэкапов (bot.log, bot.log.1, bot.log.2, ...)
+    file_handler = RotatingFileHandler(
+        'logs/bot.log', 
+        encoding='utf-8',
+        maxBytes=5*1024*1024,  # 5MB
+        backupCount=10,
+        delay=True  # Файл открывается при первой записи
+    )
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    
+    # Запись в консоль и файл идёт в отдельном потоке, event loop только кладёт записи в очередь
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[QueueHandler(log_queue)]
+    )
+    
+    # Отключаем verbose логи aiogram
+    logging.getLogger('aiogram.event').setLevel(logging.WARNING)
+
 
 logger = logging.getLogger(__name__)
 
@@ -105,13 +127,17 @@ LOGO = r"""
 ╚══════════════════════════════════════════════════════════════════════╝
 """
 
+# Логотип с версией и ссылками, собирается один раз
+_LOGO_TEXT = (
+    "\n" + LOGO.format(VERSION) + "\n"
+    "By @kapystus\n"
+    "GitHub: github.com/Hackep1551/Starvell-cardinal\n"
+    "Telegram: t.me/Starvell_cardinal\n"
+)
+
 def print_logo():
     """Вывести логотип"""
-    print("\n" + LOGO.format(VERSION))
-    print("By @kapystus")
-    print("GitHub: github.com/Hackep1551/Starvell-cardinal")
-    print("Telegram: t.me/Starvell_cardinal")
-    print()
+    print(_LOGO_TEXT)
 
 def set_console_title(title: str):
     """Установить заголовок консоли"""
@@ -131,33 +157,74 @@ def create_folders():
         "logs"
     ]
     
+    # Обычно все папки уже есть - тогда обходимся одним stat на папку без попытки mkdir
     for folder in folders:
-        Path(folder).mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(folder):
+            Path(folder).mkdir(parents=True, exist_ok=True)
 
 def check_first_run() -> bool:
-    """Проверить, первый ли это запуск"""
-    config_path = Path("configs/_main.cfg")
-    return not config_path.exists()
+    """Проверить, первый ли это запуск (один stat конфига)"""
+    return not os.path.exists("configs/_main.cfg")
 
-async def main():
-    """Главная функция"""
-    if not Path("version.py").exists():
-        logger.error("=" * 70)
-        logger.error("КРИТИЧЕСКАЯ ОШИБКА: Файл version.py не найден!")
-        logger.error("Бот не может запуститься без файла version.py")
-        logger.error("=" * 70)
-        time.sleep(5)
-        sys.exit(1)
+def fast_event_loop_factory():
+    """
+    Подключить uvloop (winloop на Windows), если он установлен - необязательная зависимость.
+    Возвращает фабрику event loop для asyncio.run(loop_factory=...) или None.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return None
     
-    # Устанавливаем заголовок
-    set_console_title(f"Starvell Bot v{VERSION}")
+    # До Python 3.12 у asyncio.run нет loop_factory - остаётся только политика
+    if sys.version_info < (3, 12):
+        asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+    return fast_loop.new_event_loop
+
+async def run_in_daemon_thread(func, *args):
+    """
+    Аналог asyncio.to_thread, но в daemon-потоке.
+    Поток, висящий в input(), не держит процесс после Ctrl+C - в отличие от пула asyncio,
+    завершения которого asyncio.run ждёт при выходе.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def runner():
+        try:
+            result = func(*args)
+        except BaseException as e:
+            callback = (deliver, future.set_exception, e)
+        else:
+            callback = (deliver, future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # Event loop уже закрыт
     
+    threading.Thread(target=runner, daemon=True).start()
+    return await future
+
+async def main():
+    """Главная функция"""
     # Переходим в директорию скрипта
     if getattr(sys, 'frozen', False):
         os.chdir(os.path.dirname(sys.executable))
     else:
         os.chdir(os.path.dirname(__file__))
     
+    # Отсутствие version.py проверять не нужно: без него падает уже импорт VERSION в начале модуля
+    
+    # Устанавливаем заголовок
+    set_console_title(f"Starvell Bot v{VERSION}")
+    
     # Создаём папки
     create_folders()
     
@@ -175,17 +242,18 @@ async def main():
             from first_setup import run_setup
             
             logger.info("Запуск мастера первоначальной установки...\n")
-            time.sleep(1)
+            await asyncio.sleep(1)
             
-            if not run_setup():
+            # Мастер ждёт ввода пользователя - выполняем его в отдельном потоке, не блокируя event loop
+            if not await run_in_daemon_thread(run_setup):
                 logger.error("Установка прервана или завершилась с ошибкой")
                 logger.info("Для повторной установки просто запустите бота снова")
-                time.sleep(3)
+                await asyncio.sleep(3)
                 return
                 
             logger.info("УСТАНОВКА ЗАВЕРШЕНА!")
             logger.info("Перезапускаю бота...\n")
-            time.sleep(2)
+            await asyncio.sleep(2)
             
         except KeyboardInterrupt:
             logger.info("\nУстановка прервана пользователем")
@@ -208,11 +276,16 @@ async def main():
         logger.info("\nПолучен сигнал остановки (Ctrl+C)")
     except Exception as e:
         logger.error(f"Критическая ошибка: {e}", exc_info=True)
-        time.sleep(5)
+        await asyncio.sleep(5)
 
 if __name__ == "__main__":
+    setup_logging()
+    loop_factory = fast_event_loop_factory()
     try:
-        asyncio.run(main())
+        if loop_factory is not None and sys.version_info >= (3, 12):
+            asyncio.run(main(), loop_factory=loop_factory)
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Завершение работы...")
     except Exception as e: